@@ -16,18 +16,41 @@ Features:
 
 """
 
-from collections import deque
+from collections import Counter, deque, namedtuple
+from dataclasses import dataclass
+from typing import Optional
+from functools import lru_cache, partial
 import heapq
+import itertools
 import networkx as nx
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+import matplotlib.colors as mcolors
+from matplotlib.collections import LineCollection
 from matplotlib.animation import FuncAnimation
 import matplotlib.animation as animation
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+import argparse
 import time
 import numpy as np
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the search kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+except ImportError:
+    # SciPy is optional: exact_heuristic() falls back to networkx
+    dijkstra = None
+
 # ═══════════════════════════════════════════════════════════════════
 # 1. STATE SPACE REPRESENTATION (5 Marks)
 # ═══════════════════════════════════════════════════════════════════
@@ -101,6 +124,9 @@ city_positions = {
 start = "Glogow"
 goal = "Plock"
 
+# Sentinel for unreached nodes in the int32 cost arrays
+INF = np.iinfo(np.int32).max
+
 # ═══════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════
@@ -112,6 +138,133 @@ def create_networkx_graph(graph):
             G.add_edge(node, neighbor, weight=weight)
     return G
 
+_fig_cache = {}
+
+def reusable_figure(key, **fig_kw):
+    """Return the figure cached under key, cleared, or create and cache a new one
+    
+    Closing a window removes its figure from pyplot, so a figure is only
+    reused while it is still open (non-blocking or file-only backends).
+    """
+    fig = _fig_cache.get(key)
+    if fig is not None and plt.fignum_exists(fig.number):
+        fig.clf()
+    else:
+        fig = plt.figure(**fig_kw)
+        _fig_cache[key] = fig
+    return fig
+
+_nx_graph_cache = {}
+
+def cached_networkx_graph(graph):
+    """Return (G, edge_labels) for graph, building them once per adjacency dict
+    
+    The drawing code never mutates G, so every visualizer built from the same
+    adjacency list shares one copy. The cache holds a reference to graph, so
+    its id() cannot be reused by another dict while the entry is alive.
+    """
+    entry = _nx_graph_cache.get(id(graph))
+    if entry is None or entry[0] is not graph:
+        G = create_networkx_graph(graph)
+        entry = (graph, G, edge_label_dict(graph))
+        _nx_graph_cache[id(graph)] = entry
+    return entry[1], entry[2]
+
+def build_csr(graph, sort_neighbors=False):
+    """Intern city names to int ids and pack the adjacency list into CSR arrays
+    
+    Returns (name_to_id, id_to_name, indptr, indices, weights). Row u holds
+    the neighbours of city u in adjacency-list order, or sorted by name when
+    sort_neighbors is set.
+    """
+    id_to_name = list(graph)
+    name_to_id = {name: i for i, name in enumerate(id_to_name)}
+    indptr = np.zeros(len(id_to_name) + 1, dtype=np.int32)
+    indices = []
+    weights = []
+    for u, name in enumerate(id_to_name):
+        neighbors = sorted(graph[name].items()) if sort_neighbors else graph[name].items()
+        for neighbor, weight in neighbors:
+            indices.append(name_to_id[neighbor])
+            weights.append(weight)
+        indptr[u + 1] = len(indices)
+    return (name_to_id, id_to_name, indptr, np.array(indices, dtype=np.int32),
+            np.array(weights, dtype=np.int32))
+
+def edge_label_dict(graph):
+    """Edge weight labels {(u, v): w} straight from the adjacency list
+    
+    Each undirected edge appears once, oriented from the endpoint networkx
+    would have added first, so labels come out exactly as with
+    nx.get_edge_attributes but without a walk over G.
+    """
+    rank = {}
+    for node, neighbors in graph.items():
+        rank.setdefault(node, len(rank))
+        for neighbor in neighbors:
+            rank.setdefault(neighbor, len(rank))
+    labels = {}
+    for node, neighbors in graph.items():
+        for neighbor, weight in neighbors.items():
+            key = (node, neighbor) if rank[node] <= rank[neighbor] else (neighbor, node)
+            labels[key] = weight
+    return labels
+
+_csr_cache = {}
+
+def cached_csr(graph, sort_neighbors=False):
+    """build_csr() memoised per adjacency dict and neighbour order
+    
+    The searches only read the arrays, so repeated runs on the same map (e.g.
+    the comparison, then the animations) share one conversion. As with
+    cached_networkx_graph, entries keep their inputs alive so ids stay unique.
+    """
+    key = (id(graph), sort_neighbors)
+    entry = _csr_cache.get(key)
+    if entry is None or entry[0] is not graph:
+        entry = (graph, build_csr(graph, sort_neighbors))
+        _csr_cache[key] = entry
+    return entry[1]
+
+def precompute_heuristic(heuristic, id_to_name):
+    """Dense int32 array of h(n) indexed by node id"""
+    return np.array([heuristic[name] for name in id_to_name], dtype=np.int32)
+
+_heuristic_cache = {}
+
+def cached_heuristic(heuristic, id_to_name):
+    """precompute_heuristic() memoised per heuristic table and id order
+    
+    A heuristic table is specific to one goal, so a new goal brings a new
+    table and a new entry; the same goal reuses the array across searches.
+    """
+    key = (id(heuristic), id(id_to_name))
+    entry = _heuristic_cache.get(key)
+    if entry is None or entry[0] is not heuristic or entry[1] is not id_to_name:
+        entry = (heuristic, id_to_name, precompute_heuristic(heuristic, id_to_name))
+        _heuristic_cache[key] = entry
+    return entry[2]
+
+def exact_heuristic(graph, goal):
+    """h(n) = true shortest road distance from n to goal
+    
+    The tightest admissible (and consistent) heuristic: A* with it only
+    expands nodes on an optimal path. Cities that cannot reach the goal get 0.
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph)
+    if dijkstra is not None:
+        n = len(id_to_name)
+        matrix = csr_matrix((weights, indices, indptr), shape=(n, n))
+        dist = dijkstra(matrix, directed=False, indices=name_to_id[goal])
+        return {name: int(d) if np.isfinite(d) else 0 for name, d in zip(id_to_name, dist)}
+    lengths = nx.single_source_dijkstra_path_length(cached_networkx_graph(graph)[0], goal)
+    return {name: lengths.get(name, 0) for name in id_to_name}
+
+# Graph sizes and CSR arrays for the map above, computed once at import
+GraphInfo = namedtuple('GraphInfo', ['n', 'm', 'csr'])
+graph_info = GraphInfo(n=len(graph), m=sum(len(v) for v in graph.values()) // 2,
+                       csr=cached_csr(graph))
+
 # ═══════════════════════════════════════════════════════════════════
 # PERFORMANCE METRICS CLASS
 # ═══════════════════════════════════════════════════════════════════
@@ -121,7 +274,8 @@ class PerformanceMetrics:
     def __init__(self):
         self.metrics = {}
     
-    def record(self, algorithm, path, cost, nodes_expanded, steps, execution_time, trace):
+    def record(self, algorithm, path, cost, nodes_expanded, steps, execution_time, trace,
+               max_open_size, max_closed_size):
         """Record metrics for an algorithm"""
         self.metrics[algorithm] = {
             'path': path,
@@ -131,8 +285,8 @@ class PerformanceMetrics:
             'steps': steps,
             'execution_time': execution_time,
             'trace': trace,
-            'max_open_size': max(len(t.get('open', [])) for t in trace),
-            'max_closed_size': max(len(t.get('closed', set())) for t in trace)
+            'max_open_size': max_open_size,
+            'max_closed_size': max_closed_size
         }
     
     def get_comparison_data(self):
@@ -184,193 +338,629 @@ class PerformanceMetrics:
         
         print("└" + "─"*25 + "┴" + "─"*15 + "┴" + "─"*15 + "┴" + "─"*15 + "┘")
 
+# ═══════════════════════════════════════════════════════════════════
+# BUCKET QUEUE (Dial's algorithm over integer f-values)
+# ═══════════════════════════════════════════════════════════════════
+# OPEN for A* is one bucket per f-value. Each bucket is a linked list of
+# entries threaded through entry_next, with -1 ending a list or marking an
+# empty bucket. Costs are whole kilometres, so f is a small int and popping is
+# a forward scan from the last popped f instead of a heap sift.
+
+def bucket_push(bucket_head, entry_next, entry_g, entry_node, count, f, g, node):
+    """Insert (g, node) into bucket f and return the new entry count
+    
+    Buckets are kept in pop order: larger g first, then lower node id.
+    Preferring larger g on f-ties drives A* through plateaus depth-first,
+    towards the goal, instead of fanning out across them.
+    """
+    entry_g[count] = g
+    entry_node[count] = node
+    prev = -1
+    cur = bucket_head[f]
+    while cur >= 0 and (entry_g[cur] > g or (entry_g[cur] == g and entry_node[cur] < node)):
+        prev = cur
+        cur = entry_next[cur]
+    entry_next[count] = cur
+    if prev < 0:
+        bucket_head[f] = count
+    else:
+        entry_next[prev] = count
+    return count + 1
+
+def bucket_pop(bucket_head, entry_next, entry_g, entry_node, cursor):
+    """Pop the best entry at or above bucket cursor; returns (f, g, node)
+    
+    The caller tracks how many entries are live and never pops an empty queue.
+    """
+    while bucket_head[cursor] < 0:
+        cursor += 1
+    entry = bucket_head[cursor]
+    bucket_head[cursor] = entry_next[entry]
+    return cursor, entry_g[entry], entry_node[entry]
+
+# Compiled copies for _astar_core. The trace generator keeps the plain
+# functions on Python lists: one call per push or pop from interpreted code
+# costs more in dispatch than the few list operations it runs
+_bucket_push = njit(cache=True)(bucket_push)
+_bucket_pop = njit(cache=True)(bucket_pop)
+
+def bucket_count(weights, h_arr):
+    """Number of f buckets needed: no g exceeds the sum of all edge weights"""
+    return int(weights.sum()) + int(h_arr.max()) + 1
+
 # ═══════════════════════════════════════════════════════════════════
 # ALGORITHMS WITH TIMING AND METRICS
 # ═══════════════════════════════════════════════════════════════════
-def dfs_collect_trace(graph, start, goal):
-    """DFS with full trace collection for animation"""
-    start_time = time.time()
+@dataclass
+class TraceEvent:
+    """One search step, stored as a change to OPEN/CLOSED instead of a full snapshot
     
-    open_list = [(start, [start], 0)]
-    closed_set = set()
-    trace = []
+    Nodes are CSR ids (-1 for none); names are only looked up for display.
+    """
+    step: float
+    action: str
+    message: str
+    current: int = -1
+    parent: int = -1
+    cost: int = 0
+    f: Optional[int] = None
+    popped: int = -1
+    pushed: tuple = ()
+    pushed_f: tuple = ()
+    closed: int = -1
+
+def path_from_parents(parents, node):
+    """Walk a parent-id array back from node to the start (-1 marks the root)"""
+    path = []
+    while node >= 0:
+        path.append(int(node))
+        node = parents[node]
+    path.reverse()
+    return path
+
+def dfs_trace_iter(graph, start, goal, record_trace=True):
+    """DFS as a generator of trace events, returning the search result when done
+    
+    With record_trace=False no events are built or yielded; the generator
+    only returns the result.
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph)
+    n = len(id_to_name)
+    start_id, goal_id = name_to_id[start], name_to_id[goal]
+    
+    # Stack entries carry their parent; the path is rebuilt from parents on demand
+    open_list = [(start_id, -1, 0)]
+    closed = np.zeros(n, dtype=bool)
+    # Peak OPEN size for the metrics; CLOSED only grows, so its peak is nodes_expanded
+    max_open = 1
+    parents = np.full(n, -1, dtype=np.int32)
     nodes_expanded = 0
     
-    trace.append({
-        'step': 0, 'current': None, 'path': [], 'cost': 0,
-        'open': [start], 'closed': set(), 'action': 'Initialize',
-        'message': f'Starting DFS from {start} to {goal}'
-    })
+    if record_trace:
+        yield TraceEvent(0, 'Initialize', f'Starting DFS from {start} to {goal}',
+                         pushed=(start_id,))
     
+    # A node closed without pushing anything has no event of its own, so its
+    # CLOSED delta rides along with the next event
+    pending_closed = -1
     step = 0
     while open_list:
         step += 1
-        current_node, path, cost = open_list.pop()
-        
-        trace.append({
-            'step': step, 'current': current_node, 'path': path.copy(),
-            'cost': cost, 'open': [n[0] for n in open_list],
-            'closed': closed_set.copy(), 'action': 'Pop from Stack',
-            'message': f'Popped {current_node} from OPEN stack'
-        })
-        
-        if current_node == goal:
-            execution_time = time.time() - start_time
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': cost, 'open': [n[0] for n in open_list],
-                'closed': closed_set.copy(), 'action': 'GOAL FOUND!',
-                'message': f'🎯 Goal {goal} reached! Cost: {cost}km'
-            })
-            return path, cost, nodes_expanded, step, execution_time, trace
-        
-        if current_node in closed_set:
+        current, parent, cost = open_list.pop()
+        current_node = id_to_name[current]
+        
+        if record_trace:
+            yield TraceEvent(step, 'Pop from Stack', f'Popped {current_node} from OPEN stack',
+                             current=current, parent=parent, cost=cost,
+                             popped=current, closed=pending_closed)
+        pending_closed = -1
+        
+        if current == goal_id:
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'GOAL FOUND!', f'🎯 Goal {goal} reached! Cost: {cost}km',
+                                 current=current, parent=parent, cost=cost)
+            path = [id_to_name[i] for i in path_from_parents(parents, parent)] + [current_node]
+            return path, int(cost), nodes_expanded, step, max_open, nodes_expanded
+        
+        if closed[current]:
             continue
         
-        closed_set.add(current_node)
+        closed[current] = True
+        parents[current] = parent
         nodes_expanded += 1
         
+        # Push in reverse adjacency order so neighbours pop in adjacency order.
+        # DFS accepts the first path it finds, so the goal is taken as soon as
+        # it is generated rather than after the siblings pushed above it
         neighbors_added = []
-        for neighbor, weight in reversed(list(graph[current_node].items())):
-            if neighbor not in closed_set:
-                open_list.append((neighbor, path + [neighbor], cost + weight))
+        for k in range(indptr[current + 1] - 1, indptr[current] - 1, -1):
+            neighbor = indices[k]
+            if neighbor == goal_id:
+                goal_cost = cost + weights[k]
+                max_open = max(max_open, len(open_list))
+                if record_trace:
+                    yield TraceEvent(step + 0.5, 'GOAL FOUND!',
+                                     f'🎯 Goal {goal} reached! Cost: {goal_cost}km',
+                                     current=goal_id, parent=current, cost=goal_cost,
+                                     pushed=tuple(neighbors_added), closed=current)
+                path = [id_to_name[i] for i in path_from_parents(parents, current)] + [goal]
+                return path, int(goal_cost), nodes_expanded, step, max_open, nodes_expanded
+            if not closed[neighbor]:
+                open_list.append((neighbor, current, cost + weights[k]))
                 neighbors_added.append(neighbor)
+        max_open = max(max_open, len(open_list))
         
         if neighbors_added:
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': cost, 'open': [n[0] for n in open_list],
-                'closed': closed_set.copy(), 'action': 'Expand',
-                'message': f'Added {neighbors_added} to OPEN'
-            })
-    
-    execution_time = time.time() - start_time
-    return None, None, nodes_expanded, step, execution_time, trace
-
-def bfs_collect_trace(graph, start, goal):
-    """BFS with full trace collection for animation"""
-    start_time = time.time()
-    
-    open_queue = deque([(start, [start], 0)])
-    closed_set = set()
-    trace = []
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'Expand',
+                                 f'Added {[id_to_name[i] for i in neighbors_added]} to OPEN',
+                                 current=current, parent=parent, cost=cost,
+                                 pushed=tuple(neighbors_added), closed=current)
+        else:
+            pending_closed = current
+    
+    return None, None, nodes_expanded, step, max_open, nodes_expanded
+
+def bfs_trace_iter(graph, start, goal, record_trace=True):
+    """BFS as a generator of trace events, returning the search result when done
+    
+    With record_trace=False no events are built or yielded; the generator
+    only returns the result.
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph, sort_neighbors=True)
+    n = len(id_to_name)
+    start_id, goal_id = name_to_id[start], name_to_id[goal]
+    
+    # Nodes are marked discovered when enqueued, so each one enters the queue
+    # at most once; the path is rebuilt from parents on demand
+    open_queue = deque([(start_id, 0)])
+    discovered = np.zeros(n, dtype=bool)
+    discovered[start_id] = True
+    # Peak OPEN size for the metrics; CLOSED only grows, so its peak is nodes_expanded
+    max_open = 1
+    parents = np.full(n, -1, dtype=np.int32)
     nodes_expanded = 0
     
-    trace.append({
-        'step': 0, 'current': None, 'path': [], 'cost': 0,
-        'open': [start], 'closed': set(), 'action': 'Initialize',
-        'message': f'Starting BFS from {start} to {goal}'
-    })
+    if record_trace:
+        yield TraceEvent(0, 'Initialize', f'Starting BFS from {start} to {goal}',
+                         pushed=(start_id,))
     
+    pending_closed = -1
     step = 0
     while open_queue:
         step += 1
-        current_node, path, cost = open_queue.popleft()
-        
-        trace.append({
-            'step': step, 'current': current_node, 'path': path.copy(),
-            'cost': cost, 'open': [n[0] for n in open_queue],
-            'closed': closed_set.copy(), 'action': 'Dequeue',
-            'message': f'Dequeued {current_node} from OPEN queue'
-        })
-        
-        if current_node == goal:
-            execution_time = time.time() - start_time
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': cost, 'open': [n[0] for n in open_queue],
-                'closed': closed_set.copy(), 'action': 'GOAL FOUND!',
-                'message': f'🎯 Goal {goal} reached! Cost: {cost}km'
-            })
-            return path, cost, nodes_expanded, step, execution_time, trace
-        
-        if current_node in closed_set:
-            continue
+        current, cost = open_queue.popleft()
+        current_node = id_to_name[current]
+        parent = parents[current]
+        
+        if record_trace:
+            yield TraceEvent(step, 'Dequeue', f'Dequeued {current_node} from OPEN queue',
+                             current=current, parent=parent, cost=cost,
+                             popped=current, closed=pending_closed)
+        pending_closed = -1
+        
+        if current == goal_id:
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'GOAL FOUND!', f'🎯 Goal {goal} reached! Cost: {cost}km',
+                                 current=current, parent=parent, cost=cost)
+            path = [id_to_name[i] for i in path_from_parents(parents, current)]
+            return path, int(cost), nodes_expanded, step, max_open, nodes_expanded
         
-        closed_set.add(current_node)
         nodes_expanded += 1
         
         neighbors_added = []
-        for neighbor, weight in sorted(graph[current_node].items()):
-            if neighbor not in closed_set:
-                open_queue.append((neighbor, path + [neighbor], cost + weight))
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if not discovered[neighbor]:
+                discovered[neighbor] = True
+                parents[neighbor] = current
+                open_queue.append((neighbor, cost + weights[k]))
                 neighbors_added.append(neighbor)
+        max_open = max(max_open, len(open_queue))
         
         if neighbors_added:
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': cost, 'open': [n[0] for n in open_queue],
-                'closed': closed_set.copy(), 'action': 'Expand',
-                'message': f'Added {neighbors_added} to OPEN'
-            })
-    
-    execution_time = time.time() - start_time
-    return None, None, nodes_expanded, step, execution_time, trace
-
-def astar_collect_trace(graph, start, goal, heuristic):
-    """A* with full trace collection for animation"""
-    start_time = time.time()
-    
-    open_pq = [(heuristic[start], 0, start, [start])]
-    closed_set = set()
-    trace = []
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'Expand',
+                                 f'Added {[id_to_name[i] for i in neighbors_added]} to OPEN',
+                                 current=current, parent=parent, cost=cost,
+                                 pushed=tuple(neighbors_added), closed=current)
+        else:
+            pending_closed = current
+    
+    return None, None, nodes_expanded, step, max_open, nodes_expanded
+
+def astar_trace_iter(graph, start, goal, heuristic, consistent_heuristic=True, record_trace=True):
+    """A* as a generator of trace events, returning the search result when done
+    
+    With consistent_heuristic the goal is accepted as soon as it is generated
+    at the f just popped; pass False to only accept it when popped. With
+    record_trace=False no events are built or yielded; the generator only
+    returns the result.
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph, sort_neighbors=True)
+    h_arr = cached_heuristic(heuristic, id_to_name)
+    n = len(id_to_name)
+    start_id, goal_id = name_to_id[start], name_to_id[goal]
+    
+    # This loop runs in the interpreter, where indexing a list is cheaper than
+    # indexing a NumPy array and getting a NumPy scalar back
+    count = bucket_count(weights, h_arr)
+    indptr, indices, weights, h_arr = indptr.tolist(), indices.tolist(), weights.tolist(), h_arr.tolist()
+    
+    # OPEN is a bucket queue of (g, node) entries keyed by f; entries whose g
+    # no longer matches best_g are stale. Every CSR entry is pushed at most
+    # once, plus the start. The heuristic is consistent, so a closed node is
+    # never reopened and f never drops below the last popped bucket
+    bucket_head = [-1] * count
+    entry_next = [0] * (len(indices) + 1)
+    entry_g = [0] * (len(indices) + 1)
+    entry_node = [0] * (len(indices) + 1)
+    entries = bucket_push(bucket_head, entry_next, entry_g, entry_node, 0, h_arr[start_id], 0, start_id)
+    cursor = h_arr[start_id]
+    open_size = 1
+    closed = [False] * n
+    # Peak OPEN size for the metrics; CLOSED only grows, so its peak is nodes_expanded
+    max_open = 1
+    parents = [-1] * n
+    best_g = [INF] * n
+    best_g[start_id] = 0
     nodes_expanded = 0
     
-    trace.append({
-        'step': 0, 'current': None, 'path': [], 'cost': 0, 'f': heuristic[start],
-        'open': [(heuristic[start], start)], 'closed': set(), 'action': 'Initialize',
-        'message': f'Starting A* from {start} to {goal}'
-    })
+    if record_trace:
+        yield TraceEvent(0, 'Initialize', f'Starting A* from {start} to {goal}',
+                         f=h_arr[start_id], pushed=(start_id,), pushed_f=(h_arr[start_id],))
     
+    pending_closed = -1
     step = 0
-    while open_pq:
+    while open_size:
         step += 1
-        f_score, g_score, current_node, path = heapq.heappop(open_pq)
-        
-        trace.append({
-            'step': step, 'current': current_node, 'path': path.copy(),
-            'cost': g_score, 'f': f_score,
-            'open': [(f, n) for f, g, n, p in open_pq],
-            'closed': closed_set.copy(), 'action': 'Pop min f(n)',
-            'message': f'Popped {current_node} with f={f_score} (g={g_score}+h={heuristic[current_node]})'
-        })
-        
-        if current_node == goal:
-            execution_time = time.time() - start_time
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': g_score, 'f': f_score,
-                'open': [(f, n) for f, g, n, p in open_pq],
-                'closed': closed_set.copy(), 'action': 'OPTIMAL GOAL!',
-                'message': f'🎯 Optimal path found! Cost: {g_score}km'
-            })
-            return path, g_score, nodes_expanded, step, execution_time, trace
-        
-        if current_node in closed_set:
+        f_score, g_score, current = bucket_pop(bucket_head, entry_next, entry_g, entry_node, cursor)
+        cursor = f_score
+        open_size -= 1
+        current_node = id_to_name[current]
+        parent = parents[current]
+        
+        if record_trace:
+            yield TraceEvent(step, 'Pop min f(n)',
+                             f'Popped {current_node} with f={f_score} (g={g_score}+h={h_arr[current]})',
+                             current=current, parent=parent, cost=g_score, f=f_score,
+                             popped=current, closed=pending_closed)
+        pending_closed = -1
+        
+        if current == goal_id:
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'OPTIMAL GOAL!', f'🎯 Optimal path found! Cost: {g_score}km',
+                                 current=current, parent=parent, cost=g_score, f=f_score)
+            path = [id_to_name[i] for i in path_from_parents(parents, current)]
+            return path, int(g_score), nodes_expanded, step, max_open, nodes_expanded
+        
+        # Skip already expanded nodes and stale entries superseded by a better g
+        if closed[current] or g_score > best_g[current]:
             continue
         
-        closed_set.add(current_node)
+        closed[current] = True
         nodes_expanded += 1
         
         neighbors_added = []
-        for neighbor, weight in sorted(graph[current_node].items()):
-            if neighbor not in closed_set:
-                new_g = g_score + weight
-                new_f = new_g + heuristic[neighbor]
-                heapq.heappush(open_pq, (new_f, new_g, neighbor, path + [neighbor]))
-                neighbors_added.append(f"{neighbor}(f={new_f})")
+        neighbors_f = []
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if not closed[neighbor]:
+                new_g = g_score + weights[k]
+                if new_g >= best_g[neighbor]:
+                    continue
+                best_g[neighbor] = new_g
+                parents[neighbor] = current
+                new_f = new_g + h_arr[neighbor]
+                # With a consistent heuristic nothing left in OPEN has f below
+                # the f just popped, so a goal generated at that f is optimal
+                if neighbor == goal_id and consistent_heuristic and new_f <= f_score:
+                    max_open = max(max_open, open_size)
+                    if record_trace:
+                        yield TraceEvent(step + 0.5, 'OPTIMAL GOAL!', f'🎯 Optimal path found! Cost: {new_g}km',
+                                         current=goal_id, parent=current, cost=new_g, f=new_f,
+                                         pushed=tuple(neighbors_added), pushed_f=tuple(neighbors_f),
+                                         closed=current)
+                    path = [id_to_name[i] for i in path_from_parents(parents, neighbor)]
+                    return path, int(new_g), nodes_expanded, step, max_open, nodes_expanded
+                entries = bucket_push(bucket_head, entry_next, entry_g, entry_node, entries,
+                                      new_f, new_g, neighbor)
+                cursor = min(cursor, new_f)
+                open_size += 1
+                neighbors_added.append(neighbor)
+                neighbors_f.append(new_f)
+        max_open = max(max_open, open_size)
         
         if neighbors_added:
-            trace.append({
-                'step': step + 0.5, 'current': current_node, 'path': path.copy(),
-                'cost': g_score, 'f': f_score,
-                'open': [(f, n) for f, g, n, p in open_pq],
-                'closed': closed_set.copy(), 'action': 'Expand',
-                'message': f'Added {len(neighbors_added)} neighbors to OPEN'
-            })
+            if record_trace:
+                yield TraceEvent(step + 0.5, 'Expand', f'Added {len(neighbors_added)} neighbors to OPEN',
+                                 current=current, parent=parent, cost=g_score, f=f_score,
+                                 pushed=tuple(neighbors_added), pushed_f=tuple(neighbors_f),
+                                 closed=current)
+        else:
+            pending_closed = current
+    
+    return None, None, nodes_expanded, step, max_open, nodes_expanded
+
+def timed_trace(events):
+    """Pass trace events through, returning the search result with its run time
     
-    execution_time = time.time() - start_time
-    return None, None, nodes_expanded, step, execution_time, trace
+    Only time spent inside the search generator is counted, not time the
+    consumer spends between events (e.g. drawing a frame).
+    """
+    elapsed = 0.0
+    while True:
+        t0 = time.perf_counter()
+        try:
+            event = next(events)
+        except StopIteration as stop:
+            elapsed += time.perf_counter() - t0
+            path, cost, nodes_expanded, steps, max_open, max_closed = stop.value
+            return path, cost, nodes_expanded, steps, elapsed, max_open, max_closed
+        elapsed += time.perf_counter() - t0
+        yield event
+
+# ═══════════════════════════════════════════════════════════════════
+# COMPILED SEARCH KERNELS (no trace, CSR arrays in, parents/costs out)
+# ═══════════════════════════════════════════════════════════════════
+class SearchArena:
+    """Work arrays shared by the compiled kernels, reset between searches
+    
+    Sized for n nodes and m CSR entries: every entry is pushed at most once,
+    plus the start, so the OPEN columns never overflow. DFS uses the node,
+    parent and g columns as its stack, BFS uses open_node as its queue and
+    A* uses the node, g and next columns as bucket queue entries.
+    """
+    
+    def __init__(self, n, m):
+        self._allocate(n, m)
+        self._bucket_head = np.empty(0, dtype=np.int32)
+    
+    def _allocate(self, n, m):
+        self.n = n
+        self.m = m
+        self.parents = np.empty(n, dtype=np.int32)
+        self.g = np.empty(n, dtype=np.int32)
+        self.closed = np.empty(n, dtype=np.bool_)
+        size = max(n, m + 1)
+        self.open_node = np.empty(size, dtype=np.int32)
+        self.open_parent = np.empty(size, dtype=np.int32)
+        self.open_g = np.empty(size, dtype=np.int32)
+        self.open_next = np.empty(size, dtype=np.int32)
+    
+    def reserve(self, n, m):
+        """Grow the arrays in place if a graph with n nodes and m CSR entries does not fit"""
+        if n > self.n or m > self.m:
+            self._allocate(max(n, self.n), max(m, self.m))
+    
+    def reset(self):
+        """Clear the per-node state; OPEN columns are overwritten as they fill"""
+        self.parents.fill(-1)
+        self.g.fill(INF)
+        self.closed.fill(False)
+    
+    def bucket_heads(self, count):
+        """Empty A* buckets for f in [0, count), growing the array on demand"""
+        if self._bucket_head.shape[0] < count:
+            self._bucket_head = np.empty(count, dtype=np.int32)
+        heads = self._bucket_head[:count]
+        heads.fill(-1)
+        return heads
+
+@njit(cache=True)
+def _dfs_core(indptr, indices, weights, start_id, goal_id,
+              parents, g, closed, stack_node, stack_parent, stack_cost):
+    """DFS over CSR arrays into reset arena arrays; returns (nodes_expanded, steps, max_open)"""
+    stack_node[0] = start_id
+    stack_parent[0] = -1
+    stack_cost[0] = 0
+    top = 1
+    max_open = 1
+    nodes_expanded = 0
+    steps = 0
+    while top > 0:
+        steps += 1
+        top -= 1
+        u = stack_node[top]
+        if u == goal_id:
+            parents[u] = stack_parent[top]
+            g[u] = stack_cost[top]
+            break
+        if closed[u]:
+            continue
+        closed[u] = True
+        parents[u] = stack_parent[top]
+        g[u] = stack_cost[top]
+        nodes_expanded += 1
+        for k in range(indptr[u + 1] - 1, indptr[u] - 1, -1):
+            v = indices[k]
+            if v == goal_id:
+                parents[v] = u
+                g[v] = g[u] + weights[k]
+                return nodes_expanded, steps, max(max_open, top)
+            if not closed[v]:
+                stack_node[top] = v
+                stack_parent[top] = u
+                stack_cost[top] = g[u] + weights[k]
+                top += 1
+        max_open = max(max_open, top)
+    return nodes_expanded, steps, max_open
+
+@njit(cache=True)
+def _bfs_core(indptr, indices, weights, start_id, goal_id, parents, g, discovered, queue):
+    """BFS over CSR arrays into reset arena arrays; returns (nodes_expanded, steps, max_open)"""
+    queue[0] = start_id
+    discovered[start_id] = True
+    g[start_id] = 0
+    head = 0
+    tail = 1
+    max_open = 1
+    nodes_expanded = 0
+    steps = 0
+    while head < tail:
+        steps += 1
+        u = queue[head]
+        head += 1
+        if u == goal_id:
+            break
+        nodes_expanded += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not discovered[v]:
+                discovered[v] = True
+                parents[v] = u
+                g[v] = g[u] + weights[k]
+                queue[tail] = v
+                tail += 1
+        max_open = max(max_open, tail - head)
+    return nodes_expanded, steps, max_open
+
+@njit(cache=True)
+def _astar_core(indptr, indices, weights, h, start_id, goal_id, early_goal,
+                parents, g, closed, bucket_head, entry_next, entry_g, entry_node):
+    """A* over CSR arrays into reset arena arrays; returns (nodes_expanded, steps, max_open)"""
+    g[start_id] = 0
+    entries = _bucket_push(bucket_head, entry_next, entry_g, entry_node, 0, h[start_id], 0, start_id)
+    cursor = h[start_id]
+    size = 1
+    max_open = 1
+    nodes_expanded = 0
+    steps = 0
+    while size > 0:
+        steps += 1
+        f_score, g_score, u = _bucket_pop(bucket_head, entry_next, entry_g, entry_node, cursor)
+        cursor = f_score
+        size -= 1
+        if u == goal_id:
+            break
+        if closed[u] or g_score > g[u]:
+            continue
+        closed[u] = True
+        nodes_expanded += 1
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if not closed[v]:
+                new_g = g_score + weights[k]
+                if new_g >= g[v]:
+                    continue
+                g[v] = new_g
+                parents[v] = u
+                new_f = new_g + h[v]
+                if v == goal_id and early_goal and new_f <= f_score:
+                    return nodes_expanded, steps, max(max_open, size)
+                entries = _bucket_push(bucket_head, entry_next, entry_g, entry_node, entries,
+                                       new_f, new_g, v)
+                cursor = min(cursor, new_f)
+                size += 1
+        max_open = max(max_open, size)
+    return nodes_expanded, steps, max_open
+
+def _core_result(parents, g, goal_id, id_to_name):
+    """Translate kernel output back into (path, cost) with city names"""
+    if g[goal_id] == INF:
+        return None, None
+    return [id_to_name[i] for i in path_from_parents(parents, goal_id)], int(g[goal_id])
+
+def _ready_arena(arena, indptr, indices):
+    """Reset arena for this graph, growing it in place if too small (or making one if None)"""
+    n, m = indptr.shape[0] - 1, indices.shape[0]
+    if arena is None:
+        arena = SearchArena(n, m)
+    arena.reserve(n, m)
+    arena.reset()
+    return arena
+
+def dfs_search(graph, start, goal, arena=None):
+    """DFS without trace collection, for callers that only need the result
+    
+    Returns (path, cost, nodes_expanded, steps, execution_time, max_open, max_closed).
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph)
+    a = _ready_arena(arena, indptr, indices)
+    # Only the kernel is timed, not the CSR lookup, arena reset or result translation
+    start_time = time.perf_counter()
+    nodes_expanded, steps, max_open = _dfs_core(
+        indptr, indices, weights, name_to_id[start], name_to_id[goal],
+        a.parents, a.g, a.closed, a.open_node, a.open_parent, a.open_g)
+    execution_time = time.perf_counter() - start_time
+    path, cost = _core_result(a.parents, a.g, name_to_id[goal], id_to_name)
+    return path, cost, nodes_expanded, steps, execution_time, max_open, nodes_expanded
+
+def bfs_search(graph, start, goal, arena=None):
+    """BFS without trace collection, for callers that only need the result
+    
+    Returns (path, cost, nodes_expanded, steps, execution_time, max_open, max_closed).
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph, sort_neighbors=True)
+    a = _ready_arena(arena, indptr, indices)
+    # Only the kernel is timed, not the CSR lookup, arena reset or result translation
+    start_time = time.perf_counter()
+    nodes_expanded, steps, max_open = _bfs_core(
+        indptr, indices, weights, name_to_id[start], name_to_id[goal],
+        a.parents, a.g, a.closed, a.open_node)
+    execution_time = time.perf_counter() - start_time
+    path, cost = _core_result(a.parents, a.g, name_to_id[goal], id_to_name)
+    return path, cost, nodes_expanded, steps, execution_time, max_open, nodes_expanded
+
+def astar_search(graph, start, goal, heuristic, arena=None, consistent_heuristic=True):
+    """A* without trace collection, for callers that only need the result
+    
+    Returns (path, cost, nodes_expanded, steps, execution_time, max_open, max_closed).
+    """
+    name_to_id, id_to_name, indptr, indices, weights = cached_csr(graph, sort_neighbors=True)
+    h_arr = cached_heuristic(heuristic, id_to_name)
+    a = _ready_arena(arena, indptr, indices)
+    bucket_head = a.bucket_heads(bucket_count(weights, h_arr))
+    # Only the kernel is timed, not the CSR lookup, arena reset or result translation
+    start_time = time.perf_counter()
+    nodes_expanded, steps, max_open = _astar_core(
+        indptr, indices, weights, h_arr, name_to_id[start], name_to_id[goal], consistent_heuristic,
+        a.parents, a.g, a.closed, bucket_head, a.open_next, a.open_g, a.open_node)
+    execution_time = time.perf_counter() - start_time
+    path, cost = _core_result(a.parents, a.g, name_to_id[goal], id_to_name)
+    return path, cost, nodes_expanded, steps, execution_time, max_open, nodes_expanded
+
+@lru_cache(maxsize=1)
+def warm_up_kernels():
+    """Compile (or load from cache) every search kernel on a two-city map before anything is timed
+    
+    Runs once; later calls return immediately.
+    """
+    tiny = {'a': {'b': 1}, 'b': {'a': 1}}
+    _, id_to_name, indptr, indices, weights = build_csr(tiny)
+    h_arr = precompute_heuristic({'a': 1, 'b': 0}, id_to_name)
+    a = SearchArena(len(id_to_name), indices.shape[0])
+    a.reset()
+    _dfs_core(indptr, indices, weights, 0, 1, a.parents, a.g, a.closed,
+              a.open_node, a.open_parent, a.open_g)
+    a.reset()
+    _bfs_core(indptr, indices, weights, 0, 1, a.parents, a.g, a.closed, a.open_node)
+    a.reset()
+    _astar_core(indptr, indices, weights, h_arr, 0, 1, True, a.parents, a.g, a.closed,
+                a.bucket_heads(bucket_count(weights, h_arr)), a.open_next, a.open_g, a.open_node)
+
+_search_cache = {}
+
+def cached_search(algorithm, graph, start, goal, heuristic=None, arena=None):
+    """Compiled search result, memoised per graph, endpoints and heuristic
+    
+    The comparison figure, the metrics and the robot path all want the same
+    searches, so each one runs once. The entry keeps graph and heuristic
+    alive, so their id()s cannot be reused while it is cached. A cache miss
+    runs in arena when one is given.
+    """
+    key = (algorithm, id(graph), start, goal, id(heuristic))
+    entry = _search_cache.get(key)
+    if entry is None or entry[0] is not graph or entry[1] is not heuristic:
+        if algorithm == 'dfs':
+            result = dfs_search(graph, start, goal, arena=arena)
+        elif algorithm == 'bfs':
+            result = bfs_search(graph, start, goal, arena=arena)
+        else:
+            result = astar_search(graph, start, goal, heuristic, arena=arena)
+        entry = (graph, heuristic, result)
+        _search_cache[key] = entry
+    return entry[2]
 
 # ═══════════════════════════════════════════════════════════════════
 # ROBOT PATH ANIMATION CLASS
@@ -378,93 +968,97 @@ def astar_collect_trace(graph, start, goal, heuristic):
 class RobotPathAnimator:
     """Animate robot moving along the final path"""
     
+    # Animation currently drawing into the shared robot figure, whichever
+    # animator started it
+    _anim = None
+    
     def __init__(self, graph, positions, path, algorithm_name):
         self.graph = graph
         self.positions = positions
         self.path = path
         self.algorithm_name = algorithm_name
-        self.G = create_networkx_graph(graph)
+        self.G, self._edge_labels = cached_networkx_graph(graph)
+        
+        # The path never changes during the animation, so everything derived
+        # from it is computed once here rather than on every frame
+        self._path_set = set(path)
+        self._path_edges = list(zip(path, path[1:]))
+        self._node_colors = []
+        for node in self.G.nodes():
+            if node == path[0]:
+                self._node_colors.append('#3498db')  # Start
+            elif node == path[-1]:
+                self._node_colors.append('#e74c3c')  # Goal
+            elif node in self._path_set:
+                self._node_colors.append('#2ecc71')  # Path
+            else:
+                self._node_colors.append('#bdc3c7')  # Other
         
     def animate(self, interval=500):
         """Animate robot moving along path"""
-        fig, ax = plt.subplots(figsize=(14, 10))
-        
-        # Create interpolated positions for smooth movement
-        self.interpolated_positions = []
-        for i in range(len(self.path) - 1):
-            start_pos = np.array(self.positions[self.path[i]])
-            end_pos = np.array(self.positions[self.path[i + 1]])
-            # Add 10 intermediate positions
-            for t in np.linspace(0, 1, 10):
-                pos = start_pos + t * (end_pos - start_pos)
-                self.interpolated_positions.append({
-                    'pos': pos,
-                    'from': self.path[i],
-                    'to': self.path[i + 1],
-                    'progress': t
-                })
+        # Each replay reuses the open robot window; the previous loop must
+        # stop drawing into it first
+        if RobotPathAnimator._anim is not None:
+            RobotPathAnimator._anim.pause()
+        fig = reusable_figure('robot', figsize=(14, 10))
+        ax = fig.add_subplot()
+        
+        # Create interpolated positions for smooth movement: 10 points per
+        # path segment, as one (frames, 2) array plus per-frame segment/progress
+        waypoints = np.array([self.positions[node] for node in self.path], dtype=float)
+        starts, ends = waypoints[:-1], waypoints[1:]
+        ts = np.linspace(0, 1, 10)
+        segments = starts[:, None, :] + ts[None, :, None] * (ends - starts)[:, None, :]
+        self.interpolated_positions = segments.reshape(-1, 2)
+        self._segment = np.repeat(np.arange(len(starts)), len(ts))
+        self._progress = np.tile(ts, len(starts))
         
         self.fig = fig
         self.ax = ax
+        self._draw_static_scene()
         
-        anim = FuncAnimation(
+        # Blitting keeps the static graph as the cached background and only
+        # redraws the robot, trail and status text on each frame
+        RobotPathAnimator._anim = FuncAnimation(
             fig, self._update_robot_frame, 
             frames=len(self.interpolated_positions),
-            interval=interval, repeat=True, blit=False
+            interval=interval, repeat=True, blit=True
         )
         
         plt.tight_layout()
         plt.show()
-        
-    def _update_robot_frame(self, frame_idx):
-        """Update robot position frame"""
-        self.ax.clear()
+    
+    def _draw_static_scene(self):
+        """Draw the graph once and create the robot, trail and status artists"""
         pos = self.positions
         
         # Draw base graph
-        node_colors = []
-        for node in self.G.nodes():
-            if node == self.path[0]:
-                node_colors.append('#3498db')  # Start
-            elif node == self.path[-1]:
-                node_colors.append('#e74c3c')  # Goal
-            elif node in self.path:
-                node_colors.append('#2ecc71')  # Path
-            else:
-                node_colors.append('#bdc3c7')  # Other
-        
         nx.draw_networkx_edges(self.G, pos, edge_color='#bdc3c7', width=2, ax=self.ax)
         
         # Draw path edges
-        path_edges = list(zip(self.path, self.path[1:]))
-        nx.draw_networkx_edges(self.G, pos, edgelist=path_edges,
+        nx.draw_networkx_edges(self.G, pos, edgelist=self._path_edges,
                                edge_color='#27ae60', width=4, ax=self.ax)
         
-        nx.draw_networkx_nodes(self.G, pos, node_color=node_colors, node_size=1800,
+        nx.draw_networkx_nodes(self.G, pos, node_color=self._node_colors, node_size=1800,
                                edgecolors='#2c3e50', linewidths=2, ax=self.ax)
         nx.draw_networkx_labels(self.G, pos, font_size=7, font_weight='bold', ax=self.ax)
         
-        edge_labels = nx.get_edge_attributes(self.G, 'weight')
-        nx.draw_networkx_edge_labels(self.G, pos, edge_labels=edge_labels, font_size=6, ax=self.ax)
-        
-        # Draw robot at current position
-        robot_pos = self.interpolated_positions[frame_idx]['pos']
-        self.ax.plot(robot_pos[0], robot_pos[1], 'ko', markersize=25, 
-                    markerfacecolor='#e67e22', markeredgewidth=3)
-        self.ax.plot(robot_pos[0], robot_pos[1], 'w*', markersize=12)
-        
-        # Draw trail
-        if frame_idx > 0:
-            trail_x = [self.interpolated_positions[i]['pos'][0] for i in range(frame_idx)]
-            trail_y = [self.interpolated_positions[i]['pos'][1] for i in range(frame_idx)]
-            self.ax.plot(trail_x, trail_y, 'o-', color='#e67e22', alpha=0.3, 
-                        markersize=5, linewidth=2)
-        
-        current_data = self.interpolated_positions[frame_idx]
-        self.ax.set_title(f"🤖 Robot Delivery Animation - {self.algorithm_name}\n"
-                         f"Moving: {current_data['from']} → {current_data['to']} "
-                         f"({int(current_data['progress']*100)}%)",
-                         fontsize=14, fontweight='bold')
+        nx.draw_networkx_edge_labels(self.G, pos, edge_labels=self._edge_labels, font_size=6, ax=self.ax)
+        
+        # Robot and trail start empty; frames only move their data
+        self._robot, = self.ax.plot([], [], 'ko', markersize=25, 
+                                    markerfacecolor='#e67e22', markeredgewidth=3)
+        self._robot_star, = self.ax.plot([], [], 'w*', markersize=12)
+        self._trail, = self.ax.plot([], [], 'o-', color='#e67e22', alpha=0.3, 
+                                    markersize=5, linewidth=2)
+        
+        # The moving status lives inside the axes: blitting only restores the
+        # axes area, so a changing set_title() would smear
+        self.ax.set_title(f"🤖 Robot Delivery Animation - {self.algorithm_name}",
+                          fontsize=14, fontweight='bold')
+        self._status_text = self.ax.text(0.5, 1.0, '', transform=self.ax.transAxes,
+                                         fontsize=12, ha='center', va='top',
+                                         fontweight='bold')
         self.ax.axis('off')
         
         # Legend
@@ -474,6 +1068,20 @@ class RobotPathAnimator:
             mpatches.Patch(color='#e67e22', label='Robot'),
         ]
         self.ax.legend(handles=legend_elements, loc='upper left', fontsize=9)
+        
+    def _update_robot_frame(self, frame_idx):
+        """Move the robot and trail to frame_idx and return the changed artists"""
+        robot_pos = self.interpolated_positions[frame_idx]
+        self._robot.set_data([robot_pos[0]], [robot_pos[1]])
+        self._robot_star.set_data([robot_pos[0]], [robot_pos[1]])
+        
+        trail = self.interpolated_positions[:frame_idx]
+        self._trail.set_data(trail[:, 0], trail[:, 1])
+        
+        segment = self._segment[frame_idx]
+        self._status_text.set_text(f"Moving: {self.path[segment]} → {self.path[segment + 1]} "
+                                   f"({int(self._progress[frame_idx]*100)}%)")
+        return self._robot, self._robot_star, self._trail, self._status_text
 
 # ═══════════════════════════════════════════════════════════════════
 # ENHANCED VISUALIZATION WITH CHARTS
@@ -577,38 +1185,90 @@ class PerformanceCharts:
 # ═══════════════════════════════════════════════════════════════════
 # REAL-TIME ANIMATED VISUALIZATION CLASS
 # ═══════════════════════════════════════════════════════════════════
+# Legend handles and panel boxes never change, so they are built once here
+# and shared by every animation (legend() and text() copy what they need)
+LEGEND_ELEMENTS = (
+    mpatches.Patch(color='#3498db', label='Start'),
+    mpatches.Patch(color='#e74c3c', label='Goal'),
+    mpatches.Patch(color='#f39c12', label='Current'),
+    mpatches.Patch(color='#f1c40f', label='Open'),
+    mpatches.Patch(color='#9b59b6', label='Closed'),
+    mpatches.Patch(color='#2ecc71', label='Path'),
+)
+INFO_BBOX = dict(boxstyle='round', facecolor='#ecf0f1', alpha=0.8)
+OPEN_BBOX = dict(boxstyle='round', facecolor='#f1c40f', alpha=0.3)
+CLOSED_BBOX = dict(boxstyle='round', facecolor='#9b59b6', alpha=0.3)
+PATH_BBOX = dict(boxstyle='round', facecolor='#3498db', alpha=0.3)
+
+# The OPEN/CLOSED panels often show the same contents for several frames
+# (and again on every replay), so their text is cached by content
+
+@lru_cache(maxsize=256)
+def _format_open(container_name, items, total, with_f):
+    """OPEN panel text for a tuple of names, or of (f, name) pairs when with_f"""
+    if with_f:
+        items = [f"{n}(f={f})" for f, n in items]
+    text = f"{container_name}\n" + "─"*40 + "\n"
+    text += " → ".join(items) if items else "(empty)"
+    if total > 8:
+        text += f" ... (+{total-8})"
+    return text
+
+@lru_cache(maxsize=256)
+def _format_closed(shown, total):
+    """CLOSED panel text for the first few closed names out of total"""
+    text = "CLOSED (Set)\n" + "─"*40 + "\n"
+    text += ", ".join(sorted(shown)) if shown else "(empty)"
+    if total > 12:
+        text += f" ... (+{total-12})"
+    return text
+
 class RealTimeSearchVisualizer:
     """Real-time animated visualization of search algorithms"""
     
+    # (colour, size) per node category; higher categories take precedence
+    NODE_OTHER, NODE_OPEN, NODE_PATH, NODE_CLOSED, NODE_GOAL, NODE_START, NODE_CURRENT = range(7)
+    NODE_STYLES = (
+        ('#bdc3c7', 1500),  # Other
+        ('#f1c40f', 1800),  # Open
+        ('#2ecc71', 2000),  # Path
+        ('#9b59b6', 1800),  # Closed
+        ('#e74c3c', 2200),  # Goal
+        ('#3498db', 2200),  # Start
+        ('#f39c12', 2500),  # Current
+    )
+    
     def __init__(self, graph, start, goal, heuristic, positions):
         self.graph = graph
         self.start = start
         self.goal = goal
         self.heuristic = heuristic
         self.positions = positions
-        self.G = create_networkx_graph(graph)
+        self.G, self._edge_labels = cached_networkx_graph(graph)
+        # Trace events carry CSR ids; names are only needed for display
+        self._name_to_id, self._names = cached_csr(graph)[:2]
         
     def animate_search(self, algorithm='astar', interval=800, save_gif=False):
         """Animate the search algorithm in real-time"""
-        # Collect trace
+        # The search runs lazily: each playback pulls a fresh event stream
         if algorithm == 'dfs':
-            path, cost, nodes_exp, steps, exec_time, trace = dfs_collect_trace(
-                self.graph, self.start, self.goal)
+            trace_iter = partial(dfs_trace_iter, self.graph, self.start, self.goal)
             title = "Depth-First Search (DFS) - Real-Time"
             container_name = "OPEN (Stack - LIFO)"
         elif algorithm == 'bfs':
-            path, cost, nodes_exp, steps, exec_time, trace = bfs_collect_trace(
-                self.graph, self.start, self.goal)
+            trace_iter = partial(bfs_trace_iter, self.graph, self.start, self.goal)
             title = "Breadth-First Search (BFS) - Real-Time"
             container_name = "OPEN (Queue - FIFO)"
         else:
-            path, cost, nodes_exp, steps, exec_time, trace = astar_collect_trace(
-                self.graph, self.start, self.goal, self.heuristic)
+            trace_iter = partial(astar_trace_iter, self.graph, self.start, self.goal, self.heuristic)
             title = "A* Search - Real-Time"
             container_name = "OPEN (Priority Queue)"
         
         # Setup figure
-        fig = plt.figure(figsize=(16, 10))
+        # A still-running animation must not keep drawing into a reused figure
+        if getattr(self, '_anim', None) is not None:
+            self._anim.pause()
+        fig = reusable_figure('search', figsize=(16, 10))
         gs = fig.add_gridspec(3, 4, height_ratios=[4, 1, 1], hspace=0.3, wspace=0.3)
         
         ax_graph = fig.add_subplot(gs[0, :3])
@@ -624,16 +1284,19 @@ class RealTimeSearchVisualizer:
         self.ax_open = ax_open
         self.ax_closed = ax_closed
         self.ax_path = ax_path
-        self.trace = trace
-        self.final_path = path
-        self.final_cost = cost
+        self._trace_iter = trace_iter
+        self._result = None
         self.title = title
         self.container_name = container_name
         self.algorithm = algorithm
-        
-        anim = FuncAnimation(
-            fig, self._update_frame, frames=len(trace),
-            interval=interval, repeat=False, blit=False
+        self._reset_caches()
+        self._init_artists()
+        
+        # Frames are drawn as the search produces them, so no trace list is
+        # kept; the display and a GIF save each stream their own search
+        anim = self._anim = FuncAnimation(
+            fig, self._update_frame, frames=self._stream, init_func=self._init_frame,
+            interval=interval, repeat=False, blit=True, cache_frame_data=False
         )
         
         plt.tight_layout()
@@ -645,77 +1308,178 @@ class RealTimeSearchVisualizer:
         
         plt.show()
         
-        return path, cost, nodes_exp, steps, exec_time, trace
-    
-    def _update_frame(self, frame_idx):
-        """Update a single frame of animation"""
-        state = self.trace[frame_idx]
-        
-        self.ax_graph.clear()
-        self.ax_info.clear()
-        self.ax_open.clear()
-        self.ax_closed.clear()
-        self.ax_path.clear()
-        
-        pos = self.positions
+        # The window may be closed before the last frame; rerun the search
+        # without building events so the result is still available
+        if self._result is None:
+            for _ in self._stream(record_trace=False):
+                pass
+        path, cost, nodes_exp, steps, exec_time, max_open, max_closed = self._result
+        self.final_path = path
+        self.final_cost = cost
         
-        # Node colors
-        node_colors = []
-        node_sizes = []
-        for node in self.G.nodes():
-            if node == state.get('current'):
-                node_colors.append('#f39c12')
-                node_sizes.append(2500)
-            elif node == self.start:
-                node_colors.append('#3498db')
-                node_sizes.append(2200)
-            elif node == self.goal:
-                node_colors.append('#e74c3c')
-                node_sizes.append(2200)
-            elif node in state.get('closed', set()):
-                node_colors.append('#9b59b6')
-                node_sizes.append(1800)
-            elif node in state.get('path', []):
-                node_colors.append('#2ecc71')
-                node_sizes.append(2000)
-            elif node in [n if isinstance(n, str) else n[1] for n in state.get('open', [])]:
-                node_colors.append('#f1c40f')
-                node_sizes.append(1800)
+        # No trace is kept, so its slot in the result is None
+        return path, cost, nodes_exp, steps, exec_time, None, max_open, max_closed
+    
+    def _stream(self, record_trace=True):
+        """Start a fresh search and yield its events, keeping the result once it finishes"""
+        self._reset_caches()
+        self._result = yield from timed_trace(self._trace_iter(record_trace=record_trace))
+    
+    def _reset_caches(self):
+        """Clear the OPEN/CLOSED state rebuilt from the trace deltas"""
+        # DFS/BFS pop from the ends of the deque; A* pops by (f, node), so its
+        # OPEN is a tally of those pairs and removal needs no scan
+        self._open_cache = deque()
+        self._open_tally = Counter()
+        # CLOSED is a mask over the node ids; only the first few names are
+        # kept as strings, for the panel
+        self._closed_mask = np.zeros(len(self._names), dtype=bool)
+        self._closed_count = 0
+        self._closed_shown = []
+        self._parents = np.full(len(self._names), -1, dtype=np.int32)
+    
+    def _apply_event(self, event):
+        """Apply one trace event to the cached OPEN/CLOSED containers"""
+        if event.popped >= 0:
+            if self.algorithm == 'dfs':
+                self._open_cache.pop()
+            elif self.algorithm == 'bfs':
+                self._open_cache.popleft()
             else:
-                node_colors.append('#bdc3c7')
-                node_sizes.append(1500)
-        
+                entry = (event.f, event.popped)
+                self._open_tally[entry] -= 1
+                if not self._open_tally[entry]:
+                    del self._open_tally[entry]
+        if self.algorithm == 'astar':
+            self._open_tally.update(zip(event.pushed_f, event.pushed))
+        else:
+            self._open_cache.extend(event.pushed)
+        if event.closed >= 0:
+            self._closed_mask[event.closed] = True
+            self._closed_count += 1
+            if len(self._closed_shown) < 12:
+                self._closed_shown.append(self._names[event.closed])
+        if event.current >= 0 and not self._closed_mask[event.current]:
+            self._parents[event.current] = event.parent
+    
+    def _init_artists(self):
+        """Draw the static scene once and keep handles to the artists frames update"""
+        pos = self.positions
+        # Nodes are drawn in id order, so per-node arrays index by trace ids
+        self._node_xy = np.array([pos[name] for name in self._names], dtype=float)
+        self._start_id = self._name_to_id[self.start]
+        self._goal_id = self._name_to_id[self.goal]
+        self._node_rgba = mcolors.to_rgba_array([color for color, _ in self.NODE_STYLES])
+        self._node_size_table = np.array([size for _, size in self.NODE_STYLES])
+        
+        # Graph: base edges stay in the blit background, everything above them
+        # is redrawn each frame so the stacking order matches a full redraw
         nx.draw_networkx_edges(self.G, pos, edge_color='#bdc3c7', width=2, 
                                alpha=0.5, ax=self.ax_graph)
+        self._path_lines = LineCollection([], colors='#27ae60', linewidths=4, zorder=1)
+        self.ax_graph.add_collection(self._path_lines)
+        self._node_collection = nx.draw_networkx_nodes(
+            self.G, pos, nodelist=self._names, node_color=self.NODE_STYLES[self.NODE_OTHER][0],
+            node_size=self.NODE_STYLES[self.NODE_OTHER][1], edgecolors='#2c3e50',
+            linewidths=2, ax=self.ax_graph)
+        node_labels = nx.draw_networkx_labels(self.G, pos, font_size=7, font_weight='bold',
+                                              ax=self.ax_graph)
+        edge_labels = nx.draw_networkx_edge_labels(self.G, pos, edge_labels=self._edge_labels,
+                                                   font_size=6, ax=self.ax_graph)
         
-        if len(state.get('path', [])) > 1:
-            path_edges = list(zip(state['path'], state['path'][1:]))
-            nx.draw_networkx_edges(self.G, pos, edgelist=path_edges,
-                                   edge_color='#27ae60', width=4, ax=self.ax_graph)
+        # Robot icon
+        self._robot, = self.ax_graph.plot([], [], 'k*', markersize=20, 
+                                          markeredgecolor='white', markeredgewidth=2)
+        
+        # The step line lives inside the axes: blitting only restores the axes
+        # area, so a changing set_title() would smear
+        self.ax_graph.set_title(self.title, fontsize=14, fontweight='bold')
+        self._step_text = self.ax_graph.text(1.0, 1.0, '', transform=self.ax_graph.transAxes,
+                                             fontsize=12, ha='right', va='top',
+                                             fontweight='bold')
+        self.ax_graph.axis('off')
         
-        nx.draw_networkx_nodes(self.G, pos, node_color=node_colors, 
-                               node_size=node_sizes, edgecolors='#2c3e50',
-                               linewidths=2, ax=self.ax_graph)
+        # Legend
+        self._legend = self.ax_graph.legend(handles=LEGEND_ELEMENTS, loc='upper left',
+                                            fontsize=8, ncol=3)
         
-        nx.draw_networkx_labels(self.G, pos, font_size=7, font_weight='bold',
-                                ax=self.ax_graph)
+        # Info Panel
+        self.ax_info.axis('off')
+        self._info_text = self.ax_info.text(0.05, 0.95, '', transform=self.ax_info.transAxes,
+                                            fontsize=9, verticalalignment='top', fontfamily='monospace',
+                                            bbox=INFO_BBOX)
         
-        edge_labels = nx.get_edge_attributes(self.G, 'weight')
-        nx.draw_networkx_edge_labels(self.G, pos, edge_labels=edge_labels,
-                                     font_size=6, ax=self.ax_graph)
+        # Open Container
+        self.ax_open.axis('off')
+        self._open_text = self.ax_open.text(0.5, 0.5, '', transform=self.ax_open.transAxes,
+                                            fontsize=10, ha='center', va='center', fontfamily='monospace',
+                                            bbox=OPEN_BBOX)
+        self.ax_open.set_title("OPEN Container", fontsize=10, fontweight='bold')
+        
+        # Closed Container
+        self.ax_closed.axis('off')
+        self._closed_text = self.ax_closed.text(0.5, 0.5, '', transform=self.ax_closed.transAxes,
+                                                fontsize=10, ha='center', va='center', fontfamily='monospace',
+                                                bbox=CLOSED_BBOX)
+        self.ax_closed.set_title("CLOSED Container", fontsize=10, fontweight='bold')
+        
+        # Path
+        self.ax_path.axis('off')
+        self._path_text = self.ax_path.text(0.5, 0.5, '', transform=self.ax_path.transAxes,
+                                            fontsize=12, ha='center', va='center', fontweight='bold',
+                                            bbox=PATH_BBOX)
+        
+        self._animated_artists = (
+            self._path_lines, self._node_collection, *node_labels.values(),
+            *edge_labels.values(), self._robot, self._step_text, self._legend,
+            self._info_text, self._open_text, self._closed_text, self._path_text,
+        )
+    
+    def _init_frame(self):
+        """Blit init: the artists start empty, so just hand them to the animation"""
+        return self._animated_artists
+    
+    def _update_frame(self, event):
+        """Apply the next trace event and return the changed artists"""
+        self._apply_event(event)
+        if event.current >= 0:
+            current_path = path_from_parents(self._parents, event.parent) + [event.current]
+        else:
+            current_path = []
+        if self.algorithm == 'astar':
+            open_set = {node for _, node in self._open_tally}
+            open_size = sum(self._open_tally.values())
+        else:
+            open_set = set(self._open_cache)
+            open_size = len(self._open_cache)
+        
+        xy = self._node_xy
+        
+        # Node colors: assign categories in increasing precedence, then look up
+        # colour and size for every node at once
+        category = np.full(len(self._names), self.NODE_OTHER, dtype=np.intp)
+        category[list(open_set)] = self.NODE_OPEN
+        category[current_path] = self.NODE_PATH
+        category[self._closed_mask] = self.NODE_CLOSED
+        category[self._goal_id] = self.NODE_GOAL
+        category[self._start_id] = self.NODE_START
+        if event.current >= 0:
+            category[event.current] = self.NODE_CURRENT
+        self._node_collection.set_facecolor(self._node_rgba[category])
+        self._node_collection.set_sizes(self._node_size_table[category])
+        
+        self._path_lines.set_segments(np.stack((xy[current_path[:-1]], xy[current_path[1:]]), axis=1))
         
         # Robot icon
-        if state.get('current'):
-            curr_pos = pos[state['current']]
-            self.ax_graph.plot(curr_pos[0], curr_pos[1], 'k*', markersize=20, 
-                              markeredgecolor='white', markeredgewidth=2)
+        if event.current >= 0:
+            curr_pos = xy[event.current]
+            self._robot.set_data([curr_pos[0]], [curr_pos[1]])
+        else:
+            self._robot.set_data([], [])
         
-        self.ax_graph.set_title(f"{self.title}\nStep {int(state['step'])}: {state.get('action', '')}",
-                                fontsize=14, fontweight='bold')
-        self.ax_graph.axis('off')
+        self._step_text.set_text(f"Step {int(event.step)}: {event.action}")
         
         # Info Panel
-        self.ax_info.axis('off')
         info_text = f"""
 ALGORITHM INFO
 ══════════════════
@@ -725,115 +1489,119 @@ Goal: {self.goal}
 
 CURRENT STATE
 ══════════════════
-Step: {int(state['step'])}
-Current: {state.get('current', 'N/A')}
-Cost: {state.get('cost', 0)} km
-Path Len: {len(state.get('path', []))}
+Step: {int(event.step)}
+Current: {self._names[event.current] if event.current >= 0 else None}
+Cost: {event.cost} km
+Path Len: {len(current_path)}
 
 ACTION
 ══════════════════
-{state.get('action', '')}
+{event.action}
 
-{state.get('message', '')}
+{event.message}
 """
-        self.ax_info.text(0.05, 0.95, info_text, transform=self.ax_info.transAxes,
-                         fontsize=9, verticalalignment='top', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#ecf0f1', alpha=0.8))
+        self._info_text.set_text(info_text)
         
         # Open Container
-        self.ax_open.axis('off')
-        open_list = state.get('open', [])
+        names = self._names
         if self.algorithm == 'astar':
-            open_display = [f"{n[1]}(f={n[0]})" if isinstance(n, tuple) else str(n) 
-                           for n in open_list[:8]]
+            open_display = tuple((f, names[node]) for f, node in heapq.nsmallest(
+                8, self._open_tally.elements(), key=lambda entry: (entry[0], names[entry[1]])))
         else:
-            open_display = open_list[:10]
-        
-        open_text = f"{self.container_name}\n" + "─"*40 + "\n"
-        open_text += " → ".join(map(str, open_display)) if open_display else "(empty)"
-        if len(open_list) > 8:
-            open_text += f" ... (+{len(open_list)-8})"
-        
-        self.ax_open.text(0.5, 0.5, open_text, transform=self.ax_open.transAxes,
-                         fontsize=10, ha='center', va='center', fontfamily='monospace',
-                         bbox=dict(boxstyle='round', facecolor='#f1c40f', alpha=0.3))
-        self.ax_open.set_title("OPEN Container", fontsize=10, fontweight='bold')
+            open_display = tuple(names[node] for node in itertools.islice(self._open_cache, 10))
+        self._open_text.set_text(_format_open(self.container_name, open_display, open_size,
+                                              self.algorithm == 'astar'))
         
         # Closed Container
-        self.ax_closed.axis('off')
-        closed_set = state.get('closed', set())
-        closed_text = "CLOSED (Set)\n" + "─"*40 + "\n"
-        closed_text += ", ".join(sorted(list(closed_set)[:12])) if closed_set else "(empty)"
-        if len(closed_set) > 12:
-            closed_text += f" ... (+{len(closed_set)-12})"
-        
-        self.ax_closed.text(0.5, 0.5, closed_text, transform=self.ax_closed.transAxes,
-                           fontsize=10, ha='center', va='center', fontfamily='monospace',
-                           bbox=dict(boxstyle='round', facecolor='#9b59b6', alpha=0.3))
-        self.ax_closed.set_title("CLOSED Container", fontsize=10, fontweight='bold')
+        self._closed_text.set_text(_format_closed(tuple(self._closed_shown), self._closed_count))
         
         # Path
-        self.ax_path.axis('off')
-        current_path = state.get('path', [])
-        path_text = "PATH: " + (" → ".join(current_path) if current_path else "(empty)")
-        path_text += f"  |  Cost: {state.get('cost', 0)} km"
+        path_text = "PATH: " + (" → ".join(names[i] for i in current_path) if current_path else "(empty)")
+        path_text += f"  |  Cost: {event.cost} km"
         
-        color = '#27ae60' if 'GOAL' in state.get('action', '') else '#3498db'
-        self.ax_path.text(0.5, 0.5, path_text, transform=self.ax_path.transAxes,
-                         fontsize=12, ha='center', va='center', fontweight='bold',
-                         bbox=dict(boxstyle='round', facecolor=color, alpha=0.3))
+        color = '#27ae60' if 'GOAL' in event.action else '#3498db'
+        self._path_text.set_text(path_text)
+        self._path_text.get_bbox_patch().set_facecolor(color)
         
-        # Legend
-        legend_elements = [
-            mpatches.Patch(color='#3498db', label='Start'),
-            mpatches.Patch(color='#e74c3c', label='Goal'),
-            mpatches.Patch(color='#f39c12', label='Current'),
-            mpatches.Patch(color='#f1c40f', label='Open'),
-            mpatches.Patch(color='#9b59b6', label='Closed'),
-            mpatches.Patch(color='#2ecc71', label='Path'),
-        ]
-        self.ax_graph.legend(handles=legend_elements, loc='upper left', fontsize=8, ncol=3)
+        return self._animated_artists
 
 # ═══════════════════════════════════════════════════════════════════
 # STATIC COMPARISON
 # ═══════════════════════════════════════════════════════════════════
+def compute_comparison(graph, start, goal, heuristic):
+    """Run DFS, BFS and A* and return their results keyed by algorithm"""
+    # Only final paths and counters are needed, so the compiled searches are
+    # used and no trace is recorded. All three run in one arena: results are
+    # copied out, so each search can reset it for the next
+    warm_up_kernels()
+    _, id_to_name, _, indices, _ = cached_csr(graph)
+    arena = SearchArena(len(id_to_name), indices.shape[0])
+    dfs_result = cached_search('dfs', graph, start, goal, arena=arena)
+    bfs_result = cached_search('bfs', graph, start, goal, arena=arena)
+    astar_result = cached_search('astar', graph, start, goal, heuristic, arena=arena)
+    
+    return {
+        'dfs': {'path': dfs_result[0], 'cost': dfs_result[1], 
+                'nodes_expanded': dfs_result[2], 'steps': dfs_result[3],
+                'execution_time': dfs_result[4], 'trace': None,
+                'max_open_size': dfs_result[5], 'max_closed_size': dfs_result[6]},
+        'bfs': {'path': bfs_result[0], 'cost': bfs_result[1],
+                'nodes_expanded': bfs_result[2], 'steps': bfs_result[3],
+                'execution_time': bfs_result[4], 'trace': None,
+                'max_open_size': bfs_result[5], 'max_closed_size': bfs_result[6]},
+        'astar': {'path': astar_result[0], 'cost': astar_result[1],
+                  'nodes_expanded': astar_result[2], 'steps': astar_result[3],
+                  'execution_time': astar_result[4], 'trace': None,
+                  'max_open_size': astar_result[5], 'max_closed_size': astar_result[6]}
+    }
+
 def draw_comparison_static(graph, positions, start, goal, heuristic):
     """Draw static comparison"""
-    dfs_result = dfs_collect_trace(graph, start, goal)
-    bfs_result = bfs_collect_trace(graph, start, goal)
-    astar_result = astar_collect_trace(graph, start, goal, heuristic)
-    
-    fig, axes = plt.subplots(1, 3, figsize=(20, 7))
+    results = compute_comparison(graph, start, goal, heuristic)
+    _render_comparison(results, graph, positions, start, goal)
+    return results
+
+def _render_comparison(results, graph, positions, start, goal):
+    """Draw the three result paths side by side and save algorithm_comparison.png"""
+    fig = reusable_figure('comparison', figsize=(20, 7))
+    axes = fig.subplots(1, 3)
     fig.suptitle('Algorithm Comparison: Glogow → Plock', fontsize=16, fontweight='bold')
     
-    G = create_networkx_graph(graph)
+    G, edge_labels = cached_networkx_graph(graph)
     
-    results = [
-        (dfs_result[0], dfs_result[1], "DFS", axes[0]),
-        (bfs_result[0], bfs_result[1], "BFS", axes[1]),
-        (astar_result[0], astar_result[1], "A* (Optimal)", axes[2])
+    panels = [
+        (results['dfs']['path'], results['dfs']['cost'], "DFS", axes[0]),
+        (results['bfs']['path'], results['bfs']['cost'], "BFS", axes[1]),
+        (results['astar']['path'], results['astar']['cost'], "A* (Optimal)", axes[2])
     ]
     
-    for path, cost, name, ax in results:
-        node_colors = []
-        for node in G.nodes():
-            if node == start:
-                node_colors.append('#3498db')
-            elif node == goal:
-                node_colors.append('#e74c3c')
-            elif node in path:
-                node_colors.append('#2ecc71')
-            else:
-                node_colors.append('#bdc3c7')
-        
-        nx.draw_networkx_edges(G, positions, edge_color='#bdc3c7', width=1.5, ax=ax)
-        path_edges = list(zip(path, path[1:]))
-        nx.draw_networkx_edges(G, positions, edgelist=path_edges,
-                               edge_color='#27ae60', width=4, ax=ax)
-        nx.draw_networkx_nodes(G, positions, node_color=node_colors,
+    # Node order is the same in all three panels; each panel scatters its
+    # path, start and goal colours into one array over that order
+    nodes_list = list(G.nodes())
+    node_index = {node: i for i, node in enumerate(nodes_list)}
+    
+    # Edge geometry is shared too: build the segments and the padded view
+    # limits once; each axes still needs its own LineCollection artists
+    edge_segments = np.array([(positions[u], positions[v]) for u, v in G.edges()], dtype=float)
+    lo = edge_segments.reshape(-1, 2).min(axis=0)
+    hi = edge_segments.reshape(-1, 2).max(axis=0)
+    pad = 0.05 * (hi - lo)
+    view_corners = (lo - pad, hi + pad)
+    
+    for path, cost, name, ax in panels:
+        node_colors = np.full(len(nodes_list), '#bdc3c7', dtype=object)
+        node_colors[[node_index[node] for node in path]] = '#2ecc71'
+        node_colors[node_index[start]] = '#3498db'
+        node_colors[node_index[goal]] = '#e74c3c'
+        
+        ax.add_collection(LineCollection(edge_segments, colors='#bdc3c7', linewidths=1.5, zorder=1))
+        path_segments = [(positions[u], positions[v]) for u, v in zip(path, path[1:])]
+        ax.add_collection(LineCollection(path_segments, colors='#27ae60', linewidths=4, zorder=1))
+        ax.update_datalim(view_corners)
+        ax.autoscale_view()
+        nx.draw_networkx_nodes(G, positions, node_color=node_colors.tolist(),
                                node_size=1500, edgecolors='#2c3e50', linewidths=2, ax=ax)
         nx.draw_networkx_labels(G, positions, font_size=7, font_weight='bold', ax=ax)
-        edge_labels = nx.get_edge_attributes(G, 'weight')
         nx.draw_networkx_edge_labels(G, positions, edge_labels=edge_labels, font_size=6, ax=ax)
         ax.set_title(f"{name}\nPath: {len(path)} nodes | Cost: {cost} km", 
                     fontsize=11, fontweight='bold')
@@ -842,18 +1610,6 @@ def draw_comparison_static(graph, positions, start, goal, heuristic):
     plt.tight_layout()
     plt.savefig('algorithm_comparison.png', dpi=150, bbox_inches='tight')
     plt.show()
-    
-    return {
-        'dfs': {'path': dfs_result[0], 'cost': dfs_result[1], 
-                'nodes_expanded': dfs_result[2], 'steps': dfs_result[3],
-                'execution_time': dfs_result[4], 'trace': dfs_result[5]},
-        'bfs': {'path': bfs_result[0], 'cost': bfs_result[1],
-                'nodes_expanded': bfs_result[2], 'steps': bfs_result[3],
-                'execution_time': bfs_result[4], 'trace': bfs_result[5]},
-        'astar': {'path': astar_result[0], 'cost': astar_result[1],
-                  'nodes_expanded': astar_result[2], 'steps': astar_result[3],
-                  'execution_time': astar_result[4], 'trace': astar_result[5]}
-    }
 
 # ═══════════════════════════════════════════════════════════════════
 # PRINT DISCUSSION
@@ -946,6 +1702,15 @@ PATHS:
 # MAIN EXECUTION
 # ═══════════════════════════════════════════════════════════════════
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DFS, BFS and A* on the Polish road map")
+    parser.add_argument('--exact-heuristic', action='store_true',
+                        help="run the static comparison's A* with true distances to the goal")
+    args = parser.parse_args()
+    
+    # The static comparison runs A* with the hand-made table above unless
+    # true distances to the goal were asked for
+    comparison_heuristic = exact_heuristic(graph, goal) if args.exact_heuristic else heuristic
+    
     print("\n" + "╔" + "═"*68 + "╗")
     print("║" + " GRAPH SEARCH ALGORITHMS - ENHANCED VISUALIZATION ".center(68) + "║")
     print("║" + " Robot Parcel Delivery: Glogow → Plock ".center(68) + "║")
@@ -955,9 +1720,14 @@ if __name__ == "__main__":
     print("\n" + "═"*70)
     print("1. STATE SPACE REPRESENTATION")
     print("═"*70)
-    print(f"• Total Cities: {len(graph)}")
-    print(f"• Total Roads: {sum(len(v) for v in graph.values()) // 2}")
+    print(f"• Total Cities: {graph_info.n}")
+    print(f"• Total Roads: {graph_info.m}")
     print(f"• Start: {start} | Goal: {goal}")
+    if comparison_heuristic is not heuristic:
+        print("• Comparison A* heuristic: exact distance to goal (--exact-heuristic)")
+    
+    # Compile the search kernels up front so no timed run pays for it
+    warm_up_kernels()
     
     visualizer = RealTimeSearchVisualizer(graph, start, goal, heuristic, city_positions)
     metrics = PerformanceMetrics()
@@ -992,22 +1762,22 @@ if __name__ == "__main__":
         for algo in ['dfs', 'bfs', 'astar']:
             print(f"\n▶️  {algo.upper()} Animation...")
             result = visualizer.animate_search(algo, interval=700)
-            metrics.record(algo, result[0], result[1], result[2], result[3], result[4], result[5])
+            metrics.record(algo, *result)
     elif choice == 5:
-        results = draw_comparison_static(graph, city_positions, start, goal, heuristic)
+        results = draw_comparison_static(graph, city_positions, start, goal, comparison_heuristic)
         print_discussion(results)
     elif choice == 6:
-        results = draw_comparison_static(graph, city_positions, start, goal, heuristic)
+        results = compute_comparison(graph, start, goal, comparison_heuristic)
         for algo in ['dfs', 'bfs', 'astar']:
             r = results[algo]
             metrics.record(algo, r['path'], r['cost'], r['nodes_expanded'], 
-                          r['steps'], r['execution_time'], r['trace'])
+                          r['steps'], r['execution_time'], r['trace'],
+                          r['max_open_size'], r['max_closed_size'])
         metrics.print_summary()
         charts = PerformanceCharts(metrics.metrics)
         charts.plot_all_charts()
     elif choice == 7:
-        _, _, _, _, _, trace = astar_collect_trace(graph, start, goal, heuristic)
-        path = trace[-1]['path']
+        path = cached_search('astar', graph, start, goal, heuristic)[0]
         animator = RobotPathAnimator(graph, city_positions, path, "A* Optimal Path")
         animator.animate(interval=100)
     else:
@@ -1016,13 +1786,14 @@ if __name__ == "__main__":
         
         # 1. Static comparison
         print("📊 1. Generating static comparison...")
-        results = draw_comparison_static(graph, city_positions, start, goal, heuristic)
+        results = draw_comparison_static(graph, city_positions, start, goal, comparison_heuristic)
         
         # 2. Record metrics
         for algo in ['dfs', 'bfs', 'astar']:
             r = results[algo]
             metrics.record(algo, r['path'], r['cost'], r['nodes_expanded'],
-                          r['steps'], r['execution_time'], r['trace'])
+                          r['steps'], r['execution_time'], r['trace'],
+                          r['max_open_size'], r['max_closed_size'])
         
         # 3. Print metrics
         metrics.print_summary()
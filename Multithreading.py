@@ -16,10 +16,94 @@ Features:
 
 import threading
 import time
-import random
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
-import copy
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional: without it the sorting kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+
+# ═══════════════════════════════════════════════════════════════════
+# SORTING KERNELS
+# ═══════════════════════════════════════════════════════════════════
+@njit(cache=True)
+def partition_trace(arr, low, high, trace):
+    """Lomuto partition of arr[low..high] around arr[high], in place
+    
+    Row k of trace records the k-th comparison as (j, i): arr[j] was not
+    above the pivot and was swapped into slot i, or i = -1 when it stayed
+    (including self-swaps with i == j, which are skipped).
+    Returns (pivot index, number of rows written).
+    """
+    pivot = arr[high]
+    i = low - 1
+    count = 0
+    for j in range(low, high):
+        trace[count, 0] = j
+        trace[count, 1] = -1
+        if arr[j] <= pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                trace[count, 1] = i
+        count += 1
+    if i + 1 != high:
+        arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1, count
+
+@njit(cache=True)
+def merge_trace(a, mid):
+    """Two-pointer merge of the sorted halves a[:mid] and a[mid:]
+    
+    Returns (merged, trace), where row k of trace is (left, right, side) for
+    the k-th element placed: both head indices at that point and the side
+    it was taken from (0 left, 1 right).
+    """
+    n = a.shape[0]
+    merged = np.empty(n, dtype=np.int32)
+    trace = np.empty((n, 3), dtype=np.int32)
+    left = 0
+    right = mid
+    for k in range(n):
+        trace[k, 0] = left
+        trace[k, 1] = right
+        if right >= n or (left < mid and a[left] <= a[right]):
+            merged[k] = a[left]
+            left += 1
+            trace[k, 2] = 0
+        else:
+            merged[k] = a[right]
+            right += 1
+            trace[k, 2] = 1
+    return merged, trace
+
+@njit(parallel=True, cache=True)
+def sort_halves(a, mid):
+    """Sort a[:mid] and a[mid:] in place, one half per thread and without the GIL"""
+    for k in prange(2):
+        if k == 0:
+            a[:mid].sort()
+        else:
+            a[mid:].sort()
+
+def warm_up_kernels():
+    """Compile (or load from cache) every kernel on a tiny array before the first sort"""
+    a = np.array([3, 1, 4, 2], dtype=np.int32)
+    partition_trace(a.copy(), 0, 3, np.empty((4, 2), dtype=np.int32))
+    sort_halves(a, 2)
+    merge_trace(a, 2)
+
+class SortCancelled(Exception):
+    """Raised inside a worker whose run was replaced by reset() or a new start"""
 
 class MultithreadedSortingGUI:
     """GUI Application for Multithreaded Sorting Visualization"""
@@ -36,15 +120,34 @@ class MultithreadedSortingGUI:
         self.working_array = []
         self.sorted_array = []
         self.mid_point = 0
+        self._max_val = 1
+        self._rng = np.random.default_rng()
+        
+        # Canvas items are created once per (size, canvas width, height) and
+        # then only moved or recoloured; see _init_bars()
+        self._layout = None
+        self._last_draw = None
+        self._canvas_size = None  # (width, height), kept current by <Configure>
         
         # Thread control
         self.is_sorting = False
         self.speed = 0.1  # Animation speed (seconds)
+        self._tick = threading.local()  # per-worker animation deadline and run
+        
+        # Run generation: bumped by every start and reset. Workers, frames and
+        # callbacks carry the generation they were started for and give up
+        # once it is no longer current
+        self._run = 0
+        self._futures = []
         
-        # Thread synchronization
-        self.sort_thread1_done = threading.Event()
-        self.sort_thread2_done = threading.Event()
-        self.sorting_complete = threading.Event()
+        # Thread pool reused across runs: two sorting threads and the merging
+        # thread. The merge waits on the sort futures, so no Events are needed
+        self.pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix='sort')
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        
+        # Worker threads only leave their latest frames here; the GUI thread
+        # drains it at ~60 Hz and draws the newest, however many were queued
+        self.render_q = queue.Queue(maxsize=2)
         
         # Colors
         self.colors = {
@@ -62,8 +165,14 @@ class MultithreadedSortingGUI:
             'default': '#9b59b6'
         }
         
+        # Pay the JIT cost before the first click rather than during it. This
+        # also starts Numba's thread pool from the GUI thread: started from a
+        # worker thread instead, it can hang interpreter exit
+        warm_up_kernels()
+        
         self.setup_ui()
         self.generate_array()
+        self.root.after(16, self._pump_frames)
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -146,6 +255,17 @@ class MultithreadedSortingGUI:
         
         speed_scale.configure(command=self.update_speed_label)
         
+        # Fast Mode: sort without animation, both halves truly in parallel
+        self.fast_mode = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            control_frame, text="⚡ Fast Mode",
+            variable=self.fast_mode,
+            font=('Helvetica', 11, 'bold'),
+            bg=self.colors['panel'], fg=self.colors['text'],
+            selectcolor=self.colors['accent'],
+            activebackground=self.colors['panel']
+        ).pack(side=tk.LEFT, padx=20)
+        
         # Buttons
         button_frame = tk.Frame(control_frame, bg=self.colors['panel'])
         button_frame.pack(side=tk.RIGHT, padx=20)
@@ -192,6 +312,7 @@ class MultithreadedSortingGUI:
             highlightthickness=0
         )
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.canvas.bind('<Configure>', self._on_canvas_configure)
         
         # ═══════════════════════════════════════════════════════════
         # Thread Status Panel
@@ -333,9 +454,17 @@ class MultithreadedSortingGUI:
             self.size_var.set(self.array_size)
         
         self.mid_point = self.array_size // 2
-        self.original_array = [random.randint(5, 100) for _ in range(self.array_size)]
-        self.working_array = copy.deepcopy(self.original_array)
-        self.sorted_array = [0] * self.array_size
+        self.original_array = self._rng.integers(5, 101, size=self.array_size, dtype=np.int32)
+        self.working_array = self.original_array.copy()
+        self.sorted_array = np.zeros(self.array_size, dtype=np.int32)
+        # Sorting only moves values around, so every frame shares one bar scale
+        self._max_val = int(self.original_array.max()) or 1
+        
+        # Per-bar base colours for each view, looked up by index when drawing
+        self._base_colors = ([self.colors['left_half']] * self.mid_point +
+                             [self.colors['right_half']] * (self.array_size - self.mid_point))
+        self._merge_colors = [self.colors['default']] * self.array_size
+        self._final_colors = [self.colors['merged']] * self.array_size
         
         self.reset_thread_status()
         self.draw_array(self.working_array)
@@ -345,76 +474,230 @@ class MultithreadedSortingGUI:
                  f"Left half: indices [0-{self.mid_point-1}], Right half: indices [{self.mid_point}-{self.array_size-1}]"
         )
     
-    def draw_array(self, array, highlight_indices=None, colors=None):
-        """Draw the array as bars on the canvas"""
-        self.canvas.delete("all")
+    def draw_array(self, array, highlights=None, base_colors=None):
+        """Draw the array as bars on the canvas
         
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        Bar i takes highlights[i] if present, else base_colors[i] (the
+        left/right half colours by default).
+        """
+        canvas_width, canvas_height = self.canvas_size()
         
         if canvas_width <= 1 or canvas_height <= 1:
-            self.root.after(100, lambda: self.draw_array(array, highlight_indices, colors))
+            self.root.after(100, lambda: self.draw_array(array, highlights, base_colors))
             return
+        self._last_draw = (self.draw_array, (array, highlights, base_colors))
         
         n = len(array)
         if n == 0:
             return
         
-        bar_width = (canvas_width - 40) / n
-        max_val = max(array) if max(array) > 0 else 1
+        if self._layout != (n, canvas_width, canvas_height):
+            self._init_bars(n, canvas_width, canvas_height)
+        self._show_scene('array')
         
-        for i, val in enumerate(array):
-            x0 = 20 + i * bar_width
-            x1 = x0 + bar_width - 2
-            
-            bar_height = (val / max_val) * (canvas_height - 80)
-            y0 = canvas_height - 40
-            y1 = y0 - bar_height
-            
-            # Determine color
-            if colors and i < len(colors):
-                color = colors[i]
-            elif highlight_indices and i in highlight_indices:
-                color = self.colors['comparing']
-            elif i < self.mid_point:
-                color = self.colors['left_half']
-            else:
-                color = self.colors['right_half']
+        self._update_bars(array, base_colors or self._base_colors, highlights or {}, self._max_val)
+    
+    def _init_bars(self, n, canvas_width, canvas_height):
+        """Create the canvas items for n bars once for this array and canvas size
+        
+        Every bar has a rectangle and value label in both the array view and
+        the merge view. Index labels and the midpoint marker never change, so
+        frames only move or recolour the bars whose value or colour changed.
+        """
+        self.canvas.delete("all")
+        self._layout = (n, canvas_width, canvas_height)
+        bar_width = (canvas_width - 40) / n
+        self._bar_state = [None] * n
+        self._merged_state = [None] * n
+        self._scene = None
+        
+        # Bar extents and centres are fixed for this layout
+        self._x0 = [20 + i * bar_width for i in range(n)]
+        self._x1 = [x0 + bar_width - 2 for x0 in self._x0]
+        self._xc = [(x0 + x1) / 2 for x0, x1 in zip(self._x0, self._x1)]
+        
+        y0 = canvas_height - 40
+        self.bar_ids, self.value_ids = [], []
+        self.merged_bar_ids, self.merged_value_ids = [], []
+        for i in range(n):
+            x0, x1 = self._x0[i], self._x1[i]
             
-            # Draw bar
-            self.canvas.create_rectangle(
-                x0, y0, x1, y1,
-                fill=color, outline='white', width=1
-            )
+            # Bars start flat and invisible until their first frame
+            self.bar_ids.append(self.canvas.create_rectangle(
+                x0, y0, x1, y0, outline='white', width=1, tags='array'
+            ))
+            self.merged_bar_ids.append(self.canvas.create_rectangle(
+                x0, y0, x1, y0, fill=self.colors['merged'], outline='white', width=1,
+                tags=('merged', 'empty')
+            ))
             
             # Draw value on top
             if bar_width > 20:
-                self.canvas.create_text(
-                    (x0 + x1) / 2, y1 - 10,
-                    text=str(val), fill='white',
-                    font=('Helvetica', 8, 'bold')
-                )
+                self.value_ids.append(self.canvas.create_text(
+                    (x0 + x1) / 2, y0, text='', fill='white',
+                    font=('Helvetica', 8, 'bold'), tags='array'
+                ))
+                self.merged_value_ids.append(self.canvas.create_text(
+                    (x0 + x1) / 2, y0, text='', fill='white',
+                    font=('Helvetica', 8, 'bold'), tags=('merged', 'empty')
+                ))
             
-            # Draw index below
-            if bar_width > 15:
+        
+        self._draw_static_overlay(n, canvas_width, canvas_height)
+    
+    def _draw_static_overlay(self, n, canvas_width, canvas_height):
+        """Create the index labels, midpoint marker and merge caption
+        
+        These items are tagged 'static' and are only rebuilt when the array
+        size or canvas geometry changes.
+        """
+        self.canvas.delete('static')
+        bar_width = (canvas_width - 40) / n
+        y0 = canvas_height - 40
+        
+        # Draw index below
+        if bar_width > 15:
+            for i in range(n):
                 self.canvas.create_text(
-                    (x0 + x1) / 2, y0 + 15,
+                    self._xc[i], y0 + 15,
                     text=str(i), fill='gray',
-                    font=('Helvetica', 7)
+                    font=('Helvetica', 7), tags=('array', 'static', 'index_label_%d' % i)
                 )
         
         # Draw midpoint line
         mid_x = 20 + self.mid_point * bar_width - 1
         self.canvas.create_line(
             mid_x, 20, mid_x, canvas_height - 20,
-            fill='yellow', width=2, dash=(5, 3)
+            fill='yellow', width=2, dash=(5, 3), tags=('array', 'static', 'static_midpoint')
         )
         self.canvas.create_text(
             mid_x, 10, text="↓ Midpoint ↓",
-            fill='yellow', font=('Helvetica', 9, 'bold')
+            fill='yellow', font=('Helvetica', 9, 'bold'), tags=('array', 'static', 'static_midpoint')
         )
         
-        self.root.update()
+        # Label
+        self.canvas.create_text(
+            canvas_width / 2, canvas_height - 20,
+            text="Merged Array (Sorted)",
+            fill=self.colors['merged'],
+            font=('Helvetica', 10, 'bold'), tags=('merged', 'static')
+        )
+    
+    def canvas_size(self):
+        """Return the cached canvas (width, height), asking Tk only until it is mapped"""
+        if self._canvas_size is None:
+            width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+            if width <= 1 or height <= 1:
+                return width, height
+            self._canvas_size = (width, height)
+        return self._canvas_size
+    
+    def _on_canvas_configure(self, event):
+        """Cache the new canvas size and redraw the last frame at that size"""
+        size = (event.width, event.height)
+        if size == self._canvas_size:
+            return
+        self._canvas_size = size
+        if self._layout is not None and self._last_draw is not None:
+            draw, args = self._last_draw
+            draw(*args)
+    
+    def _show_scene(self, scene):
+        """Show the 'array' or 'merged' view and hide the other one"""
+        if scene == self._scene:
+            return
+        self.canvas.itemconfig('merged' if scene == 'array' else 'array', state='hidden')
+        self.canvas.itemconfig(scene, state='normal')
+        # Merge slots not filled yet stay hidden
+        self.canvas.itemconfig('empty', state='hidden')
+        self._scene = scene
+    
+    def _update_bars(self, values, base_colors, highlights, max_val):
+        """Move and recolour the array-view bars whose value or colour changed"""
+        y0 = self._layout[2] - 40
+        height = self._layout[2] - 80
+        bar_state = self._bar_state
+        for i, val in enumerate(values.tolist()):
+            color = highlights.get(i) or base_colors[i]
+            state = (val, color, max_val)
+            old = bar_state[i]
+            if state == old:
+                continue
+            bar_state[i] = state
+            
+            # Highlight frames usually only recolour a bar; skip the geometry
+            # and label calls when its height did not change
+            if old is None or old[0] != val or old[2] != max_val:
+                y1 = y0 - (val / max_val) * height
+                self.canvas.coords(self.bar_ids[i], self._x0[i], y0, self._x1[i], y1)
+                if self.value_ids:
+                    self.canvas.coords(self.value_ids[i], self._xc[i], y1 - 10)
+                    self.canvas.itemconfig(self.value_ids[i], text=str(val))
+            if old is None or old[1] != color:
+                self.canvas.itemconfig(self.bar_ids[i], fill=color)
+    
+    def _update_merged_bars(self, values, max_val):
+        """Resize the merge-view bars whose value changed; zero means not merged yet"""
+        y0 = self._layout[2] - 40
+        height = (self._layout[2] - 100) / 2
+        merged_state = self._merged_state
+        for i, val in enumerate(values.tolist()):
+            state = (val, max_val)
+            if state == merged_state[i]:
+                continue
+            merged_state[i] = state
+            
+            items = [self.merged_bar_ids[i]] + self.merged_value_ids[i:i + 1]
+            if val == 0:
+                for item in items:
+                    self.canvas.addtag_withtag('empty', item)
+                    self.canvas.itemconfig(item, state='hidden')
+                continue
+            for item in items:
+                self.canvas.dtag(item, 'empty')
+                self.canvas.itemconfig(item, state='normal')
+            
+            y1 = y0 - (val / max_val) * height
+            self.canvas.coords(self.merged_bar_ids[i], self._x0[i], y0, self._x1[i], y1)
+            if self.merged_value_ids:
+                self.canvas.coords(self.merged_value_ids[i], self._xc[i], y1 - 10)
+                self.canvas.itemconfig(self.merged_value_ids[i], text=str(val))
+    
+    def request_frame(self, draw, *args, **kwargs):
+        """Ask the GUI thread to call draw(*args, **kwargs); only the latest request is drawn"""
+        frame = (self._tick.run, draw, args, kwargs)
+        while True:
+            try:
+                self.render_q.put_nowait(frame)
+                return
+            except queue.Full:
+                # Drop the oldest frame to make room for the newest
+                try:
+                    self.render_q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _take_frames(self):
+        """Empty the render queue and return the newest frame, or None"""
+        frame = None
+        while True:
+            try:
+                frame = self.render_q.get_nowait()
+            except queue.Empty:
+                return frame
+    
+    def _pump_frames(self):
+        """Draw the newest queued frame, then poll again in 16 ms"""
+        frame = self._take_frames()
+        if frame is not None:
+            run, draw, args, kwargs = frame
+            if run == self._run:
+                draw(*args, **kwargs)
+        self.root.after(16, self._pump_frames)
+    
+    def cancel_frame(self):
+        """Drop queued worker frames so they cannot overwrite a final redraw"""
+        self._take_frames()
     
     def reset_thread_status(self):
         """Reset all thread status indicators"""
@@ -438,8 +721,6 @@ class MultithreadedSortingGUI:
         elif thread_id == 3:
             self.merge_indicator.itemconfig('indicator', fill=color)
             self.merge_status.config(text=status, fg=color)
-        
-        self.root.update()
     
     def start_sorting(self):
         """Start the multithreaded sorting process"""
@@ -447,7 +728,7 @@ class MultithreadedSortingGUI:
             messagebox.showwarning("Warning", "Sorting already in progress!")
             return
         
-        if not self.working_array:
+        if not len(self.working_array):
             messagebox.showwarning("Warning", "Please generate an array first!")
             return
         
@@ -455,222 +736,283 @@ class MultithreadedSortingGUI:
         self.start_btn.config(state=tk.DISABLED)
         self.generate_btn.config(state=tk.DISABLED)
         
-        # Reset events
-        self.sort_thread1_done.clear()
-        self.sort_thread2_done.clear()
-        self.sorting_complete.clear()
-        
         # Reset working array
-        self.working_array = copy.deepcopy(self.original_array)
-        self.sorted_array = [0] * self.array_size
+        self.working_array = self.original_array.copy()
+        self.sorted_array = np.zeros(self.array_size, dtype=np.int32)
         
         self.info_label.config(text="🚀 Starting multithreaded sorting...")
         
-        # Start sorting in a separate thread to not block GUI
-        main_thread = threading.Thread(target=self.run_sorting)
-        main_thread.start()
+        self.run_sorting()
     
     def run_sorting(self):
-        """Run the sorting process with threads"""
-        # Create threads
-        thread1 = threading.Thread(
-            target=self.sorting_thread_visual,
-            args=(1, 0, self.mid_point)
-        )
-        thread2 = threading.Thread(
-            target=self.sorting_thread_visual,
-            args=(2, self.mid_point, self.array_size)
-        )
-        merge_thread = threading.Thread(target=self.merging_thread_visual)
-        
-        # Start sorting threads
-        thread1.start()
-        thread2.start()
-        merge_thread.start()
-        
-        # Wait for completion
-        thread1.join()
-        thread2.join()
-        merge_thread.join()
+        """Run the sorting process with threads
+        
+        Only submits work to the pool, so it does not block the GUI; the
+        completion callback is scheduled when the last future finishes.
+        """
+        self._run += 1
+        run = self._run
+        if self.fast_mode.get():
+            done = self.pool.submit(self.run_fast_sorting, run)
+            self._futures = [done]
+        else:
+            sort1 = self.pool.submit(self.sorting_thread_visual, run, 1, 0, self.mid_point)
+            sort2 = self.pool.submit(self.sorting_thread_visual, run, 2, self.mid_point, self.array_size)
+            done = self.pool.submit(self.merging_thread_visual, run, sort1, sort2)
+            self._futures = [sort1, sort2, done]
         
         # Final update
-        self.root.after(0, self.sorting_complete_callback)
+        done.add_done_callback(lambda future: self.root.after(0, self.finish_run, run, future))
+    
+    def finish_run(self, run, future):
+        """Report the end of a run on the GUI thread, unless reset() has replaced it"""
+        if run != self._run or future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            self.sorting_complete_callback()
+            return
+        if isinstance(error, SortCancelled):
+            return
+        
+        self.cancel_frame()
+        self.is_sorting = False
+        self.start_btn.config(state=tk.NORMAL)
+        self.generate_btn.config(state=tk.NORMAL)
+        self.info_label.config(text=f"❌ Sorting failed: {error!r}")
+        messagebox.showerror("Error", f"Sorting failed:\n\n{error!r}")
+        # Let Tk report the traceback as well
+        raise error
+    
+    def begin_worker(self, run):
+        """Tie the calling worker thread to run"""
+        self._tick.run = run
+        self.check_run()
+    
+    def check_run(self):
+        """Raise SortCancelled if this worker's run is no longer the current one"""
+        if self._tick.run != self._run:
+            raise SortCancelled
     
-    def sorting_thread_visual(self, thread_id, start_idx, end_idx):
+    def post_status(self, *args):
+        """Schedule update_thread_status(*args) unless this worker's run is replaced first"""
+        run = self._tick.run
+        
+        def update():
+            if run == self._run:
+                self.update_thread_status(*args)
+        self.root.after(0, update)
+    
+    def retire_run(self):
+        """End the current run: queued workers are cancelled, running ones stop
+        at their next check, and its completion callback is ignored
+        """
+        self._run += 1
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+    
+    def close(self):
+        """Stop the thread pool and close the window"""
+        # Animating workers must stop too: the pool threads are not daemons,
+        # so exit would otherwise wait for the whole sort to play out
+        self.retire_run()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def run_fast_sorting(self, run):
+        """Sort and merge in compiled code with no per-step animation
+        
+        Python threads take turns on the GIL, so the animated threads never
+        sort in parallel; sort_halves() releases it and uses two real threads.
+        """
+        # Bound before the run check: reset() replaces these arrays after
+        # bumping the run, so a stale worker only ever sorts its own copies
+        working, sorted_array = self.working_array, self.sorted_array
+        self.begin_worker(run)
+        for thread_id in (1, 2, 3):
+            self.post_status(thread_id, "⚡ Fast mode...", self.colors['comparing'])
+        
+        sort_halves(working, self.mid_point)
+        sorted_array[:] = merge_trace(working, self.mid_point)[0]
+        
+        for thread_id in (1, 2, 3):
+            self.post_status(thread_id, "✅ Complete", self.colors['success'])
+    
+    def sorting_thread_visual(self, run, thread_id, start_idx, end_idx):
         """Sorting thread with visual updates"""
-        self.root.after(0, lambda: self.update_thread_status(
-            thread_id, "🔄 Sorting...", self.colors['comparing']
-        ))
+        self.begin_worker(run)
+        self.post_status(thread_id, "🔄 Sorting...", self.colors['comparing'])
         
         # Visual quick sort
+        self.start_ticks()
         self.visual_quick_sort(thread_id, start_idx, end_idx - 1)
         
-        self.root.after(0, lambda: self.update_thread_status(
-            thread_id, "✅ Complete", self.colors['success']
-        ))
-        
-        if thread_id == 1:
-            self.sort_thread1_done.set()
-        else:
-            self.sort_thread2_done.set()
+        self.post_status(thread_id, "✅ Complete", self.colors['success'])
+    
+    def start_ticks(self):
+        """Start this worker's animation clock at the current time"""
+        self._tick.deadline = time.perf_counter()
+    
+    def wait_tick(self, fraction=1.0):
+        """Sleep until this worker's next animation tick
+        
+        Deadlines accumulate from start_ticks(), so sleep overshoot (about
+        15 ms on Windows) is absorbed by later ticks instead of adding up.
+        Raises SortCancelled once the worker's run has been replaced.
+        """
+        self.check_run()
+        step = self.speed * fraction
+        if step <= 0:
+            return
+        self._tick.deadline += step
+        delay = self._tick.deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
     
     def visual_quick_sort(self, thread_id, low, high):
-        """Quick sort with visualization"""
-        if low < high:
+        """Quick sort with visualization
+        
+        Iterative over an explicit stack of (low, high) ranges. The smaller
+        side is always pushed last so it is sorted first, which bounds the
+        stack at O(log n) entries.
+        """
+        stack = [(low, high)]
+        while stack:
+            low, high = stack.pop()
+            if low >= high:
+                continue
             pivot_idx = self.visual_partition(thread_id, low, high)
-            self.visual_quick_sort(thread_id, low, pivot_idx - 1)
-            self.visual_quick_sort(thread_id, pivot_idx + 1, high)
+            left, right = (low, pivot_idx - 1), (pivot_idx + 1, high)
+            if left[1] - left[0] > right[1] - right[0]:
+                stack.append(left)
+                stack.append(right)
+            else:
+                stack.append(right)
+                stack.append(left)
     
     def visual_partition(self, thread_id, low, high):
         """Partition with visualization"""
-        pivot = self.working_array[high]
-        i = low - 1
-        
-        for j in range(low, high):
+        arr = self.working_array
+        self.check_run()
+        
+        # Median-of-three: leave the median of arr[low], arr[mid], arr[high]
+        # at high so sorted and reversed runs do not degrade to O(n^2)
+        mid = (low + high) // 2
+        if high - low >= 2:
+            swapped = False
+            if arr[mid] < arr[low]:
+                arr[low], arr[mid] = arr[mid], arr[low]
+                swapped = True
+            if arr[high] < arr[low]:
+                arr[low], arr[high] = arr[high], arr[low]
+                swapped = True
+            if arr[mid] < arr[high]:
+                arr[mid], arr[high] = arr[high], arr[mid]
+                swapped = True
+            if swapped:
+                self.request_frame(self.draw_array, arr.copy())
+                self.wait_tick(0.5)
+        
+        # The compiled kernel partitions a copy of the range and records its
+        # comparisons and swaps; the animation then replays them on the array
+        segment = arr[low:high + 1].copy()
+        trace = np.empty((high - low + 1, 2), dtype=np.int32)
+        pivot_idx, count = partition_trace(segment, 0, high - low, trace)
+        pivot_idx += low
+        
+        # Loop-invariant lookups bound once for the replay
+        comparing = self.colors['comparing']
+        request_frame, draw_array, wait_tick = self.request_frame, self.draw_array, self.wait_tick
+        for j, i in trace[:count].tolist():
+            j += low
             # Highlight comparing elements
-            self.root.after(0, lambda j=j, high=high: self.draw_array(
-                self.working_array, highlight_indices={j, high}
-            ))
-            time.sleep(self.speed)
+            request_frame(draw_array, arr.copy(), {j: comparing, high: comparing})
+            wait_tick()
             
-            if self.working_array[j] <= pivot:
-                i += 1
-                self.working_array[i], self.working_array[j] = self.working_array[j], self.working_array[i]
+            if i >= 0:
+                i += low
+                arr[i], arr[j] = arr[j], arr[i]
                 
-                self.root.after(0, lambda: self.draw_array(self.working_array))
-                time.sleep(self.speed / 2)
-        
-        self.working_array[i + 1], self.working_array[high] = self.working_array[high], self.working_array[i + 1]
+                request_frame(draw_array, arr.copy())
+                wait_tick(0.5)
         
-        self.root.after(0, lambda: self.draw_array(self.working_array))
-        time.sleep(self.speed / 2)
+        if pivot_idx != high:
+            arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
+            
+            self.request_frame(self.draw_array, arr.copy())
+            self.wait_tick(0.5)
         
-        return i + 1
+        return pivot_idx
     
-    def merging_thread_visual(self):
-        """Merging thread with visualization"""
-        self.root.after(0, lambda: self.update_thread_status(
-            3, "⏳ Waiting for sorts...", 'gray'
-        ))
+    def merging_thread_visual(self, run, *sort_futures):
+        """Merging thread with visualization, started once both sort futures are done"""
+        self.begin_worker(run)
+        self.post_status(3, "⏳ Waiting for sorts...", 'gray')
         
         # Wait for both sorting threads
-        self.sort_thread1_done.wait()
-        self.sort_thread2_done.wait()
-        
-        self.root.after(0, lambda: self.update_thread_status(
-            3, "🔀 Merging...", self.colors['comparing']
-        ))
-        self.root.after(0, lambda: self.info_label.config(
+        for future in sort_futures:
+            future.result()
+        
+        # Bound before the run check, as in run_fast_sorting()
+        working, sorted_array = self.working_array, self.sorted_array
+        self.check_run()
+        self.post_status(3, "🔀 Merging...", self.colors['comparing'])
+        self.root.after(0, lambda: run == self._run and self.info_label.config(
             text="🔀 Both halves sorted! Now merging..."
         ))
         
-        # Merge the two halves
-        left_idx = 0
-        right_idx = self.mid_point
-        merge_idx = 0
-        
-        while left_idx < self.mid_point and right_idx < self.array_size:
-            # Highlight elements being compared
-            colors = [self.colors['default']] * self.array_size
-            colors[left_idx] = self.colors['comparing']
-            colors[right_idx] = self.colors['comparing']
-            
-            self.root.after(0, lambda c=colors: self.draw_array(self.working_array, colors=c))
-            time.sleep(self.speed)
+        # Merge the two halves in one compiled pass, then replay the merge
+        # trace for the animation
+        merged, trace = merge_trace(working, self.mid_point)
+        self.start_ticks()
+        
+        # Loop-invariant lookups bound once for the replay
+        comparing = self.colors['comparing']
+        mid, n = self.mid_point, self.array_size
+        merge_colors = self._merge_colors
+        request_frame, wait_tick = self.request_frame, self.wait_tick
+        draw_array, draw_merged_progress = self.draw_array, self.draw_merged_progress
+        for merge_idx, (left_idx, right_idx, side) in enumerate(trace.tolist()):
+            # Both halves still have elements: highlight the two being compared
+            if left_idx < mid and right_idx < n:
+                request_frame(draw_array, working, {left_idx: comparing, right_idx: comparing}, merge_colors)
+                wait_tick()
             
-            if self.working_array[left_idx] <= self.working_array[right_idx]:
-                self.sorted_array[merge_idx] = self.working_array[left_idx]
-                left_idx += 1
-            else:
-                self.sorted_array[merge_idx] = self.working_array[right_idx]
-                right_idx += 1
-            merge_idx += 1
+            sorted_array[merge_idx] = merged[merge_idx]
             
             # Draw merged portion
-            self.root.after(0, lambda: self.draw_merged_progress())
-            time.sleep(self.speed / 2)
-        
-        # Copy remaining elements
-        while left_idx < self.mid_point:
-            self.sorted_array[merge_idx] = self.working_array[left_idx]
-            left_idx += 1
-            merge_idx += 1
-            self.root.after(0, lambda: self.draw_merged_progress())
-            time.sleep(self.speed / 2)
-        
-        while right_idx < self.array_size:
-            self.sorted_array[merge_idx] = self.working_array[right_idx]
-            right_idx += 1
-            merge_idx += 1
-            self.root.after(0, lambda: self.draw_merged_progress())
-            time.sleep(self.speed / 2)
-        
-        self.root.after(0, lambda: self.update_thread_status(
-            3, "✅ Complete", self.colors['success']
-        ))
+            request_frame(draw_merged_progress)
+            wait_tick(0.5)
         
-        self.sorting_complete.set()
+        self.post_status(3, "✅ Complete", self.colors['success'])
     
     def draw_merged_progress(self):
         """Draw the merge progress"""
-        self.canvas.delete("all")
-        
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self.canvas_size()
         
         n = len(self.sorted_array)
-        bar_width = (canvas_width - 40) / n
-        max_val = max(max(self.sorted_array) if any(self.sorted_array) else 1,
-                      max(self.working_array) if self.working_array else 1)
+        self._last_draw = (self.draw_merged_progress, ())
+        if self._layout != (n, canvas_width, canvas_height):
+            self._init_bars(n, canvas_width, canvas_height)
+        self._show_scene('merged')
         
         # Draw sorted array (bottom half)
-        for i, val in enumerate(self.sorted_array):
-            if val == 0:
-                continue
-                
-            x0 = 20 + i * bar_width
-            x1 = x0 + bar_width - 2
-            
-            bar_height = (val / max_val) * ((canvas_height - 100) / 2)
-            y0 = canvas_height - 40
-            y1 = y0 - bar_height
-            
-            self.canvas.create_rectangle(
-                x0, y0, x1, y1,
-                fill=self.colors['merged'], outline='white', width=1
-            )
-            
-            if bar_width > 20:
-                self.canvas.create_text(
-                    (x0 + x1) / 2, y1 - 10,
-                    text=str(val), fill='white',
-                    font=('Helvetica', 8, 'bold')
-                )
-        
-        # Label
-        self.canvas.create_text(
-            canvas_width / 2, canvas_height - 20,
-            text="Merged Array (Sorted)",
-            fill=self.colors['merged'],
-            font=('Helvetica', 10, 'bold')
-        )
-        
-        self.root.update()
+        self._update_merged_bars(self.sorted_array, self._max_val)
     
     def sorting_complete_callback(self):
         """Callback when sorting is complete"""
         # Draw final sorted array
-        colors = [self.colors['merged']] * self.array_size
-        self.draw_array(self.sorted_array, colors=colors)
+        self.cancel_frame()
+        self.draw_array(self.sorted_array, base_colors=self._final_colors)
         
         # Verify
-        is_sorted = all(self.sorted_array[i] <= self.sorted_array[i + 1] 
-                       for i in range(len(self.sorted_array) - 1))
+        is_sorted = bool(np.all(np.diff(self.sorted_array) >= 0))
         
         status = "✅ CORRECTLY" if is_sorted else "❌ NOT"
         self.info_label.config(
             text=f"🎉 Sorting Complete! Array is {status} sorted. "
-                 f"Original: {self.original_array[:5]}... → Sorted: {self.sorted_array[:5]}..."
+                 f"Original: {self.original_array[:5].tolist()}... → Sorted: {self.sorted_array[:5].tolist()}..."
         )
         
         self.is_sorting = False
@@ -681,21 +1023,20 @@ class MultithreadedSortingGUI:
             messagebox.showinfo(
                 "Success! 🎉",
                 f"Array sorted successfully!\n\n"
-                f"Original: {self.original_array}\n\n"
-                f"Sorted: {self.sorted_array}"
+                f"Original: {self.original_array.tolist()}\n\n"
+                f"Sorted: {self.sorted_array.tolist()}"
             )
     
     def reset(self):
         """Reset the application"""
+        self.retire_run()
         self.is_sorting = False
-        self.sort_thread1_done.set()
-        self.sort_thread2_done.set()
-        self.sorting_complete.set()
         
-        self.working_array = copy.deepcopy(self.original_array)
-        self.sorted_array = [0] * self.array_size
+        self.working_array = self.original_array.copy()
+        self.sorted_array = np.zeros(self.array_size, dtype=np.int32)
         
         self.reset_thread_status()
+        self.cancel_frame()
         self.draw_array(self.working_array)
         
         self.start_btn.config(state=tk.NORMAL)
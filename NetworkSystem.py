@@ -22,14 +22,33 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import networkx as nx
 import matplotlib.pyplot as plt
+import matplotlib.colors as mcolors
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import numpy as np
 import time
 import threading
-from collections import deque
+from collections import deque, namedtuple
+from functools import lru_cache
+from itertools import islice
 import heapq
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the graph kernels run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import minimum_spanning_tree
+except ImportError:
+    # SciPy is optional: mst_pairs() falls back to the Union-Find kernel
+    minimum_spanning_tree = None
+
 # --------------------------------
 # Graph Initialization
 # --------------------------------
@@ -47,6 +66,8 @@ pos = nx.spring_layout(G, seed=42, k=2)
 vulnerable_roads = set()
 failed_nodes = set()
 animation_speed = 0.5
+graph_version = 0  # bumped by graph_changed() whenever G is edited
+pos_version = 0    # graph_version that pos was last checked against
 
 # Command hierarchy tree
 class CommandNode:
@@ -98,6 +119,33 @@ COLORS = {
     "mst_edge": "#a6e3a1"
 }
 
+# --------------------------------
+# Dialog Styles (shared by the pop-up windows)
+# --------------------------------
+OPTION_STYLE = dict(bg=COLORS["card"], fg=COLORS["text"], selectcolor=COLORS["surface"],
+                    font=("Segoe UI", 10), activebackground=COLORS["card"])
+RESULT_TEXT_STYLE = dict(bg=COLORS["surface"], fg=COLORS["text"], font=("Consolas", 10), wrap=tk.WORD)
+
+PATH_RESULT_TAGS = (
+    ("header", dict(foreground=COLORS["lavender"], font=("Consolas", 11, "bold"))),
+    ("path", dict(foreground=COLORS["success"])),
+    ("info", dict(foreground=COLORS["warning"])),
+    ("error", dict(foreground=COLORS["error"])),
+    ("best", dict(foreground=COLORS["teal"], font=("Consolas", 10, "bold"))),
+)
+TRAVERSAL_TAGS = (
+    ("title", dict(foreground=COLORS["lavender"], font=("Consolas", 10, "bold"))),
+    ("node", dict(foreground=COLORS["success"])),
+    ("info", dict(foreground=COLORS["warning"])),
+)
+FAILURE_RESULT_TAGS = (
+    ("header", dict(foreground=COLORS["lavender"], font=("Consolas", 11, "bold"))),
+    ("danger", dict(foreground=COLORS["error"])),
+    ("warning", dict(foreground=COLORS["warning"])),
+    ("success", dict(foreground=COLORS["success"])),
+    ("info", dict(foreground=COLORS["accent"])),
+)
+
 # --------------------------------
 # Main Window Setup
 # --------------------------------
@@ -374,20 +422,65 @@ for i, (key, label, icon) in enumerate(result_items):
 # --------------------------------
 # Helper Functions
 # --------------------------------
+refresh_pending = False
+
+def schedule_refresh():
+    """Coalesce widget refreshes from the update_* helpers into one idle pass"""
+    global refresh_pending
+    if not refresh_pending:
+        refresh_pending = True
+        root.after_idle(run_refresh)
+
+def run_refresh():
+    global refresh_pending
+    refresh_pending = False
+    root.update_idletasks()
+
+def graph_changed():
+    """Invalidate everything cached for the current graph"""
+    global graph_version
+    graph_version += 1
+
+log_buffer = []  # (line, tag) pairs waiting for the next flush_log()
+log_flush_pending = False
+log_lock = threading.Lock()
+
 def log_message(message, tag="step"):
-    log_text.config(state=tk.NORMAL)
+    global log_flush_pending
     timestamp = time.strftime("%H:%M:%S")
     
     icons = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌", 
              "step": "→", "title": "═", "highlight": "★"}
     
     icon = icons.get(tag, "→")
-    log_text.insert(tk.END, f"[{timestamp}] {icon} {message}\n", tag)
+    with log_lock:
+        log_buffer.append((f"[{timestamp}] {icon} {message}\n", tag))
+        if log_flush_pending:
+            return
+        log_flush_pending = True
+    root.after_idle(flush_log)
+
+def flush_log():
+    """Write all buffered log lines with a single Text insert"""
+    global log_flush_pending
+    with log_lock:
+        lines = log_buffer[:]
+        log_buffer.clear()
+        log_flush_pending = False
+    if not lines:
+        return
+    
+    chunks = []
+    for line, tag in lines:
+        chunks += [line, tag]
+    log_text.config(state=tk.NORMAL)
+    log_text.insert(tk.END, *chunks)
     log_text.see(tk.END)
     log_text.config(state=tk.DISABLED)
-    root.update_idletasks()
 
 def clear_log():
+    with log_lock:
+        log_buffer.clear()
     log_text.config(state=tk.NORMAL)
     log_text.delete(1.0, tk.END)
     log_text.config(state=tk.DISABLED)
@@ -396,7 +489,7 @@ def update_algo_info(name, complexity, description=""):
     algo_name_label.config(text=name)
     algo_complexity_label.config(text=complexity)
     algo_desc_label.config(text=description)
-    root.update_idletasks()
+    schedule_refresh()
 
 def update_results(nodes=None, edges=None, weight=None, result=None):
     if nodes is not None:
@@ -407,7 +500,7 @@ def update_results(nodes=None, edges=None, weight=None, result=None):
         results_labels["weight"].config(text=f"{weight:.2f}" if isinstance(weight, float) else str(weight))
     if result is not None:
         results_labels["result"].config(text=str(result))
-    root.update_idletasks()
+    schedule_refresh()
 
 def update_status(message, status_type="info"):
     icons = {"info": "ℹ️", "success": "✅", "warning": "⚠️", "error": "❌", "processing": "⏳"}
@@ -417,15 +510,64 @@ def update_status(message, status_type="info"):
     
     status_icon.config(text=icons.get(status_type, "ℹ️"), fg=colors.get(status_type, COLORS["accent"]))
     status_label.config(text=message)
-    root.update_idletasks()
+    schedule_refresh()
 
 def update_progress(value):
     progress_var.set(value)
-    root.update_idletasks()
+    schedule_refresh()
 
 # --------------------------------
 # Enhanced Graph Drawing
 # --------------------------------
+graph_artists = {}  # artists of the last full draw_graph(), reused by draw_graph_update()
+
+def graph_artist_key():
+    """Everything besides colours that decides which artists draw_graph() creates"""
+    return graph_version, frozenset(vulnerable_roads), frozenset(failed_nodes)
+
+def default_node_colors(visited_nodes=None, current_node=None):
+    node_colors = []
+    for node in G.nodes():
+        if current_node and node == current_node:
+            node_colors.append(COLORS["node_current"])
+        elif visited_nodes and node in visited_nodes:
+            node_colors.append(COLORS["node_visited"])
+        elif node in failed_nodes:
+            node_colors.append(COLORS["node_failed"])
+        else:
+            node_colors.append(COLORS["node_default"])
+    return node_colors
+
+def undirected_edge_set(edges):
+    """Orientation-free edge set for O(1) membership tests"""
+    return frozenset(frozenset(e) for e in edges) if edges else frozenset()
+
+def edge_layers(highlight_edges=None, path_edges=None):
+    """All edges in draw order (regular, path, highlight) with per-edge RGBA, width and style"""
+    highlight_edges = list(highlight_edges or ())
+    path_edges = list(path_edges or ())
+    layered = undirected_edge_set(highlight_edges) | undirected_edge_set(path_edges)
+    regular_edges = [e for e in G.edges() if frozenset(e) not in layered]
+    edges = regular_edges + path_edges + highlight_edges
+    
+    vulnerable = undirected_edge_set(vulnerable_roads)
+    mask_vuln = np.fromiter((frozenset(e) in vulnerable for e in regular_edges), bool, len(regular_edges))
+    path = slice(len(regular_edges), len(regular_edges) + len(path_edges))
+    highlight = slice(path.stop, len(edges))
+    
+    # Layer alphas are baked into the colours so one collection can hold every layer
+    colors = np.empty((len(edges), 4))
+    widths = np.empty(len(edges))
+    colors[:path.start] = np.where(mask_vuln[:, None], mcolors.to_rgba(COLORS["edge_vulnerable"], 0.6),
+                                   mcolors.to_rgba(COLORS["edge_default"], 0.6))
+    widths[:path.start] = np.where(mask_vuln, 2.5, 1.5)
+    colors[path] = mcolors.to_rgba(COLORS["edge_path"], 0.9)
+    widths[path] = 4
+    colors[highlight] = mcolors.to_rgba(COLORS["mst_edge"], 1.0)
+    widths[highlight] = 5
+    styles = ['solid'] * path.start + ['dashed'] * len(path_edges) + ['solid'] * len(highlight_edges)
+    return edges, colors, widths, styles
+
 def draw_graph(highlight_edges=None, node_colors=None, title="Network Graph",
                edge_labels_custom=None, visited_nodes=None, current_node=None,
                path_edges=None):
@@ -437,68 +579,36 @@ def draw_graph(highlight_edges=None, node_colors=None, title="Network Graph",
         ax.text(0.5, 0.5, "🕸️ No nodes in graph\nAdd nodes to get started!",
                 ha='center', va='center', fontsize=14, color=COLORS["subtext"],
                 transform=ax.transAxes)
-        canvas.draw()
+        canvas.draw_idle()
+        graph_artists.clear()
         return
     
-    # Update positions
-    global pos
-    for node in G.nodes():
-        if node not in pos:
-            pos[node] = (np.random.rand() * 2 - 1, np.random.rand() * 2 - 1)
-    pos = {k: v for k, v in pos.items() if k in G.nodes()}
+    # Lay out nodes that have no position yet, once per graph edit
+    global pos, pos_version
+    if pos_version != graph_version:
+        placed = [node for node in G.nodes() if node in pos]
+        if len(placed) < len(G):
+            pos = nx.spring_layout(G, seed=42, k=2, pos=pos, fixed=placed or None)
+        pos_version = graph_version
     
     # Calculate node colors
     if node_colors is None:
-        node_colors = []
-        for node in G.nodes():
-            if current_node and node == current_node:
-                node_colors.append(COLORS["node_current"])
-            elif visited_nodes and node in visited_nodes:
-                node_colors.append(COLORS["node_visited"])
-            elif node in failed_nodes:
-                node_colors.append(COLORS["node_failed"])
-            else:
-                node_colors.append(COLORS["node_default"])
+        node_colors = default_node_colors(visited_nodes, current_node)
     
-    # Draw regular edges
-    regular_edges = [e for e in G.edges() if 
-                     (highlight_edges is None or (e not in highlight_edges and (e[1], e[0]) not in highlight_edges)) and
-                     (path_edges is None or (e not in path_edges and (e[1], e[0]) not in path_edges))]
-    
-    edge_colors = []
-    edge_widths = []
-    edge_styles = []
-    
-    for edge in regular_edges:
-        if edge in vulnerable_roads or (edge[1], edge[0]) in vulnerable_roads:
-            edge_colors.append(COLORS["edge_vulnerable"])
-            edge_widths.append(2.5)
-        else:
-            edge_colors.append(COLORS["edge_default"])
-            edge_widths.append(1.5)
-    
-    if regular_edges:
-        nx.draw_networkx_edges(G, pos, ax=ax, edgelist=regular_edges,
-                               edge_color=edge_colors, width=edge_widths, alpha=0.6)
-    
-    # Draw path edges
-    if path_edges:
-        nx.draw_networkx_edges(G, pos, ax=ax, edgelist=path_edges,
-                               edge_color=COLORS["edge_path"], width=4, alpha=0.9,
-                               style='dashed')
-    
-    # Draw highlighted edges (MST, etc.)
-    if highlight_edges:
-        nx.draw_networkx_edges(G, pos, ax=ax, edgelist=highlight_edges,
-                               edge_color=COLORS["mst_edge"], width=5, alpha=1.0)
+    # Draw all edges as one collection, layered regular < path < highlighted (MST, etc.)
+    edges, edge_colors, edge_widths, edge_styles = edge_layers(highlight_edges, path_edges)
+    edge_artist = None
+    if edges:
+        edge_artist = nx.draw_networkx_edges(G, pos, ax=ax, edgelist=edges, edge_color=edge_colors,
+                                             width=edge_widths, style=edge_styles)
     
     # Draw nodes with glow effect
     # Outer glow
-    nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors,
-                           node_size=1600, alpha=0.3)
+    glow_artist = nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors,
+                                         node_size=1600, alpha=0.3)
     # Main node
-    nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors,
-                           node_size=1200, alpha=0.95, edgecolors='white', linewidths=2)
+    node_artist = nx.draw_networkx_nodes(G, pos, ax=ax, node_color=node_colors,
+                                         node_size=1200, alpha=0.95, edgecolors='white', linewidths=2)
     
     # Node labels
     nx.draw_networkx_labels(G, pos, ax=ax, font_size=12, font_weight="bold",
@@ -536,12 +646,67 @@ def draw_graph(highlight_edges=None, node_colors=None, title="Network Graph",
     
     ax.axis('off')
     fig.tight_layout()
-    canvas.draw()
+    canvas.draw_idle()
+    
+    graph_artists.clear()
+    graph_artists.update(key=graph_artist_key(), edges=edge_artist, highlighted=bool(highlight_edges),
+                         nodes=(glow_artist, node_artist), custom_labels=bool(edge_labels_custom))
     
     # Update stats
     total_weight = sum(data['weight'] for u, v, data in G.edges(data=True)) if G.number_of_edges() > 0 else 0
     update_results(nodes=G.number_of_nodes(), edges=G.number_of_edges(), weight=total_weight)
 
+def draw_graph_update(highlight_edges, title="Network Graph", node_colors=None):
+    """Animation frame: restyle the artists of the last draw_graph() in place
+    
+    Only the highlighted edge set, node colours and title may differ from that
+    draw; anything else falls back to a full draw_graph().
+    """
+    cached = graph_artists
+    if (not highlight_edges or cached.get("key") != graph_artist_key()
+            or cached["edges"] is None or not cached["highlighted"] or cached["custom_labels"]):
+        draw_graph(highlight_edges=highlight_edges, node_colors=node_colors, title=title)
+        return
+    
+    edges, edge_colors, edge_widths, edge_styles = edge_layers(highlight_edges)
+    ax.title.set_text(title)
+    cached["edges"].set_segments([(pos[u], pos[v]) for u, v in edges])
+    cached["edges"].set_color(edge_colors)
+    cached["edges"].set_linewidth(edge_widths)
+    cached["edges"].set_linestyle(edge_styles)
+    
+    if node_colors is None:
+        node_colors = default_node_colors()
+    for artist in cached["nodes"]:
+        artist.set_facecolor(node_colors)
+    canvas.draw_idle()
+
+NetworkStats = namedtuple("NetworkStats", "degrees betweenness avg_degree density clustering connected")
+stats_cache = {}  # graph_version -> NetworkStats
+
+def compute_stats():
+    """Metrics shown on the statistics tab, computed once per graph version"""
+    stats = stats_cache.get(graph_version)
+    if stats is None:
+        csr = ensure_csr()
+        order = np.fromiter((csr.label_to_idx[n] for n in G.nodes()), dtype=np.int32, count=len(G))
+        degrees = np.diff(csr.indptr)[order]
+        try:
+            avg_clustering = nx.average_clustering(G)
+        except:
+            avg_clustering = 0
+        stats = NetworkStats(
+            degrees=degrees,
+            betweenness=betweenness_centrality(csr),
+            avg_degree=degrees.sum() / len(degrees),
+            density=nx.density(G),
+            clustering=avg_clustering,
+            connected=nx.is_connected(G),
+        )
+        stats_cache.clear()
+        stats_cache[graph_version] = stats
+    return stats
+
 def draw_statistics():
     """Draw network statistics charts"""
     fig_stats.clear()
@@ -560,8 +725,8 @@ def draw_statistics():
     # 1. Degree distribution
     ax1 = fig_stats.add_subplot(gs[0, 0])
     ax1.set_facecolor("#1a1a2e")
-    degrees = [G.degree(n) for n in G.nodes()]
-    ax1.bar(list(G.nodes()), degrees, color=COLORS["accent"], alpha=0.8)
+    stats = compute_stats()
+    ax1.bar(list(G.nodes()), stats.degrees, color=COLORS["accent"], alpha=0.8)
     ax1.set_title("Node Degrees", color=COLORS["text"], fontsize=11, fontweight='bold')
     ax1.set_ylabel("Degree", color=COLORS["text"], fontsize=9)
     ax1.tick_params(colors=COLORS["text"], labelsize=8)
@@ -570,8 +735,7 @@ def draw_statistics():
     # 2. Edge weight distribution
     ax2 = fig_stats.add_subplot(gs[0, 1])
     ax2.set_facecolor("#1a1a2e")
-    weights = [data['weight'] for u, v, data in G.edges(data=True)]
-    ax2.hist(weights, bins=10, color=COLORS["teal"], alpha=0.8, edgecolor=COLORS["surface"])
+    ax2.hist(ensure_csr().edge_weights(), bins=10, color=COLORS["teal"], alpha=0.8, edgecolor=COLORS["surface"])
     ax2.set_title("Edge Weight Distribution", color=COLORS["text"], fontsize=11, fontweight='bold')
     ax2.set_xlabel("Weight", color=COLORS["text"], fontsize=9)
     ax2.set_ylabel("Frequency", color=COLORS["text"], fontsize=9)
@@ -581,9 +745,8 @@ def draw_statistics():
     ax3 = fig_stats.add_subplot(gs[1, 0])
     ax3.set_facecolor("#1a1a2e")
     
-    betweenness = nx.betweenness_centrality(G)
-    nodes = list(betweenness.keys())
-    values = list(betweenness.values())
+    nodes = list(G.nodes())
+    values = [stats.betweenness[node] for node in nodes]
     
     bars = ax3.barh(nodes, values, color=COLORS["peach"], alpha=0.8)
     ax3.set_title("Betweenness Centrality", color=COLORS["text"], fontsize=11, fontweight='bold')
@@ -595,24 +758,16 @@ def draw_statistics():
     ax4.set_facecolor("#1a1a2e")
     ax4.axis('off')
     
-    # Calculate metrics
-    avg_degree = sum(dict(G.degree()).values()) / len(G.nodes())
-    density = nx.density(G)
-    try:
-        avg_clustering = nx.average_clustering(G)
-    except:
-        avg_clustering = 0
-    
-    is_connected = "Yes ✅" if nx.is_connected(G) else "No ❌"
+    is_connected = "Yes ✅" if stats.connected else "No ❌"
     
     summary_text = f"""
     📊 Network Summary
     ─────────────────────
     Nodes: {G.number_of_nodes()}
     Edges: {G.number_of_edges()}
-    Average Degree: {avg_degree:.2f}
-    Density: {density:.4f}
-    Clustering: {avg_clustering:.4f}
+    Average Degree: {stats.avg_degree:.2f}
+    Density: {stats.density:.4f}
+    Clustering: {stats.clustering:.4f}
     Connected: {is_connected}
     Vulnerable Roads: {len(vulnerable_roads)}
     Failed Nodes: {len(failed_nodes)}
@@ -639,14 +794,10 @@ def draw_adjacency_matrix():
     ax_m = fig_matrix.add_subplot(111)
     ax_m.set_facecolor("#1a1a2e")
     
-    nodes = sorted(G.nodes())
+    csr = ensure_csr()
+    nodes = csr.labels
     n = len(nodes)
-    matrix = np.zeros((n, n))
-    
-    for i, u in enumerate(nodes):
-        for j, v in enumerate(nodes):
-            if G.has_edge(u, v):
-                matrix[i][j] = G[u][v]['weight']
+    matrix = csr.to_dense()
     
     im = ax_m.imshow(matrix, cmap='Blues', aspect='auto')
     
@@ -664,17 +815,265 @@ def draw_adjacency_matrix():
     cbar.ax.set_ylabel('Edge Weight', color=COLORS["text"], fontsize=10)
     plt.setp(plt.getp(cbar.ax.axes, 'yticklabels'), color=COLORS["text"])
     
-    # Add values to cells
-    for i in range(n):
-        for j in range(n):
-            if matrix[i][j] > 0:
-                text_color = 'white' if matrix[i][j] > matrix.max()/2 else COLORS["text"]
-                ax_m.text(j, i, f'{int(matrix[i][j])}', ha='center', va='center',
-                         color=text_color, fontsize=9, fontweight='bold')
+    # Add values to the non-empty cells
+    rows, cols = np.nonzero(matrix > 0)
+    values = matrix[rows, cols]
+    text_colors = np.where(values > matrix.max() / 2, 'white', COLORS["text"])
+    for i, j, value, text_color in zip(rows.tolist(), cols.tolist(), values.tolist(), text_colors.tolist()):
+        ax_m.text(j, i, f'{int(value)}', ha='center', va='center',
+                 color=text_color, fontsize=9, fontweight='bold')
     
     fig_matrix.tight_layout()
     canvas_matrix.draw()
 
+# --------------------------------
+# CSR Snapshot of G (rebuilt lazily after edits)
+# --------------------------------
+def csr_arrays(nodes, edge_list):
+    """Symmetric CSR (indptr, indices, data) for undirected (u, v, w) edges"""
+    idx = {node: i for i, node in enumerate(nodes)}
+    m = len(edge_list)
+    us = np.fromiter((idx[u] for u, _, _ in edge_list), dtype=np.int32, count=m)
+    vs = np.fromiter((idx[v] for _, v, _ in edge_list), dtype=np.int32, count=m)
+    ws = np.fromiter((w for _, _, w in edge_list), dtype=np.float64, count=m)
+    
+    rows = np.concatenate((us, vs))
+    cols = np.concatenate((vs, us))
+    order = np.lexsort((cols, rows))
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(rows, minlength=len(nodes)), out=indptr[1:])
+    return indptr, cols[order], np.concatenate((ws, ws))[order]
+
+class GraphCSR:
+    """Array view of G for the kernels; nodes are indexed in sorted label order"""
+    def __init__(self, graph, version):
+        self.labels = sorted(graph.nodes())
+        self.label_to_idx = {label: i for i, label in enumerate(self.labels)}
+        self.indptr, self.indices, self.weights = csr_arrays(self.labels, list(graph.edges(data='weight')))
+        self.version = version
+    
+    def rows(self):
+        """Source node of every CSR slot"""
+        return np.repeat(np.arange(len(self.labels), dtype=np.int32), np.diff(self.indptr))
+    
+    def edge_weights(self):
+        """One weight per undirected edge (the i < j half of the slots)"""
+        return self.weights[self.rows() < self.indices]
+    
+    def to_dense(self):
+        """Weighted adjacency matrix, 0 where there is no edge"""
+        n = len(self.labels)
+        matrix = np.zeros((n, n))
+        matrix[self.rows(), self.indices] = self.weights
+        return matrix
+
+graph_csr = None
+sorted_edges_cache = None  # (graph_version, edges sorted by weight, their weights)
+
+def ensure_csr():
+    """Current GraphCSR, rebuilt if G changed since the last call"""
+    global graph_csr
+    if graph_csr is None or graph_csr.version != graph_version:
+        graph_csr = GraphCSR(G, graph_version)
+    return graph_csr
+
+def sorted_edges():
+    """(u, v, w) edges of G sorted by weight (ties in G.edges() order) and a weight array"""
+    global sorted_edges_cache
+    if sorted_edges_cache is None or sorted_edges_cache[0] != graph_version:
+        edge_list = list(G.edges(data='weight'))
+        weights = np.fromiter((w for _, _, w in edge_list), dtype=np.float64, count=len(edge_list))
+        order = np.argsort(weights, kind='stable')
+        sorted_edges_cache = (graph_version, [edge_list[i] for i in order], weights[order])
+    return sorted_edges_cache[1], sorted_edges_cache[2]
+
+# --------------------------------
+# Graph Kernels (CSR arrays, compiled with Numba when available)
+# --------------------------------
+@njit(cache=True)
+def find_root(parent, x):
+    """Iterative find with two-pass path compression"""
+    root = x
+    while parent[root] != root:
+        root = parent[root]
+    while parent[x] != root:
+        parent[x], x = root, parent[x]
+    return root
+
+@njit(cache=True)
+def kruskal_csr(indptr, indices, data, n):
+    """Kruskal's MST over a symmetric CSR graph; returns the CSR slots of the tree edges"""
+    rows = np.empty(indices.shape[0], dtype=np.int32)
+    for i in range(n):
+        for p in range(indptr[i], indptr[i + 1]):
+            rows[p] = i
+    
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.int8)
+    tree = np.empty(max(n - 1, 0), dtype=np.int64)
+    taken = 0
+    for p in np.argsort(data, kind='mergesort'):
+        if taken == n - 1:
+            break
+        u, v = rows[p], indices[p]
+        if u > v:
+            continue  # each undirected edge is seen from both ends
+        ru, rv = find_root(parent, u), find_root(parent, v)
+        if ru == rv:
+            continue
+        if rank[ru] < rank[rv]:
+            ru, rv = rv, ru
+        parent[rv] = ru
+        if rank[ru] == rank[rv]:
+            rank[ru] += 1
+        tree[taken] = p
+        taken += 1
+    return tree[:taken]
+
+@njit(cache=True)
+def heap_push(heap_key, heap_val, size, key, val):
+    """Sift (key, val) up into a binary min-heap of `size` entries; returns the new size"""
+    i = size
+    while i > 0:
+        parent = (i - 1) // 2
+        if heap_key[parent] <= key:
+            break
+        heap_key[i] = heap_key[parent]
+        heap_val[i] = heap_val[parent]
+        i = parent
+    heap_key[i] = key
+    heap_val[i] = val
+    return size + 1
+
+@njit(cache=True)
+def heap_pop(heap_key, heap_val, size):
+    """Remove the smallest entry; returns (key, val, new_size)"""
+    key, val = heap_key[0], heap_val[0]
+    size -= 1
+    last_key, last_val = heap_key[size], heap_val[size]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap_key[child + 1] < heap_key[child]:
+            child += 1
+        if last_key <= heap_key[child]:
+            break
+        heap_key[i] = heap_key[child]
+        heap_val[i] = heap_val[child]
+        i = child
+    heap_key[i] = last_key
+    heap_val[i] = last_val
+    return key, val, size
+
+@njit(cache=True)
+def bidirectional_dijkstra_csr(indptr, indices, data, src, dst, n):
+    """Point-to-point Dijkstra grown from both ends; returns (length, path)
+    
+    The path is an index array, empty when dst cannot be reached. Slots with
+    an infinite weight are never relaxed, which is how callers ban nodes and
+    edges without rebuilding the arrays.
+    """
+    if src == dst:
+        return 0.0, np.full(1, src, dtype=np.int32)
+    dist = np.full((2, n), np.inf)
+    prev = np.full((2, n), -1, dtype=np.int32)
+    heap_key = np.empty((2, indices.shape[0] + 1), dtype=np.float64)
+    heap_val = np.empty((2, indices.shape[0] + 1), dtype=np.int32)
+    size = np.zeros(2, dtype=np.int64)
+    dist[0, src] = 0.0
+    dist[1, dst] = 0.0
+    size[0] = heap_push(heap_key[0], heap_val[0], 0, 0.0, src)
+    size[1] = heap_push(heap_key[1], heap_val[1], 0, 0.0, dst)
+    
+    best, meet = np.inf, -1
+    side = 1
+    while size[0] > 0 and size[1] > 0:
+        # No undiscovered path can beat best once the two frontiers sum past it
+        if heap_key[0, 0] + heap_key[1, 0] >= best:
+            break
+        side = 1 - side
+        d, u, size[side] = heap_pop(heap_key[side], heap_val[side], size[side])
+        if d > dist[side, u]:
+            continue
+        for p in range(indptr[u], indptr[u + 1]):
+            v = indices[p]
+            nd = d + data[p]
+            if nd < dist[side, v]:
+                dist[side, v] = nd
+                prev[side, v] = u
+                size[side] = heap_push(heap_key[side], heap_val[side], size[side], nd, v)
+            if dist[side, v] + dist[1 - side, v] < best:
+                best = dist[side, v] + dist[1 - side, v]
+                meet = v
+    
+    if meet < 0:
+        return np.inf, np.empty(0, dtype=np.int32)
+    half = [meet]
+    while half[-1] != src:
+        half.append(prev[0, half[-1]])
+    half.reverse()
+    while half[-1] != dst:
+        half.append(prev[1, half[-1]])
+    return best, np.array(half, dtype=np.int32)
+
+@njit(cache=True)
+def betweenness_csr(indptr, indices, n):
+    """Unweighted betweenness (Brandes), summed over ordered source/target pairs"""
+    bc = np.zeros(n)
+    order = np.empty(n, dtype=np.int32)
+    dist = np.empty(n, dtype=np.int32)
+    sigma = np.empty(n)
+    delta = np.empty(n)
+    for s in range(n):
+        dist[:] = -1
+        sigma[:] = 0.0
+        delta[:] = 0.0
+        dist[s] = 0
+        sigma[s] = 1.0
+        order[0] = s
+        head, tail = 0, 1
+        while head < tail:
+            v = order[head]
+            head += 1
+            for p in range(indptr[v], indptr[v + 1]):
+                w = indices[p]
+                if dist[w] < 0:
+                    dist[w] = dist[v] + 1
+                    order[tail] = w
+                    tail += 1
+                if dist[w] == dist[v] + 1:
+                    sigma[w] += sigma[v]
+        # Walk the BFS order backwards, pushing dependencies to predecessors
+        for k in range(tail - 1, 0, -1):
+            w = order[k]
+            for p in range(indptr[w], indptr[w + 1]):
+                v = indices[p]
+                if dist[v] == dist[w] - 1:
+                    delta[v] += sigma[v] / sigma[w] * (1.0 + delta[w])
+            bc[w] += delta[w]
+    return bc
+
+def betweenness_centrality(csr):
+    """Normalised betweenness per label, matching nx.betweenness_centrality"""
+    n = len(csr.labels)
+    bc = betweenness_csr(csr.indptr, csr.indices, n)
+    if n > 2:
+        bc = bc / ((n - 1) * (n - 2))
+    return dict(zip(csr.labels, bc.tolist()))
+
+def mst_pairs(csr):
+    """Index pairs (i < j) of the edges of a minimum spanning tree"""
+    n = len(csr.labels)
+    if minimum_spanning_tree is None:
+        slots = kruskal_csr(csr.indptr, csr.indices, csr.weights, n)
+        rows, cols = csr.rows()[slots], csr.indices[slots]
+    else:
+        tree = minimum_spanning_tree(csr_matrix((csr.weights, csr.indices, csr.indptr), shape=(n, n))).tocoo()
+        rows, cols = tree.row, tree.col
+    return set(zip(np.minimum(rows, cols).tolist(), np.maximum(rows, cols).tolist()))
+
 # --------------------------------
 # Q1: Animated MST Visualization
 # --------------------------------
@@ -687,70 +1086,61 @@ def show_mst_animated():
         messagebox.showwarning("Warning", "Graph is not connected! MST requires a connected graph.")
         return
     
-    def run_animation():
-        clear_log()
-        update_algo_info(
-            "Kruskal's MST Algorithm",
-            "Time: O(E log E) | Space: O(V)",
-            "Finds minimum cost spanning tree using greedy edge selection with Union-Find."
-        )
-        update_status("Computing MST...", "processing")
-        
-        log_message("═══ MINIMUM SPANNING TREE (Kruskal's) ═══", "title")
-        log_message("Finding minimum cost network connections\n", "info")
-        
-        # Get sorted edges
-        edges = [(u, v, data['weight']) for u, v, data in G.edges(data=True)]
-        edges.sort(key=lambda x: x[2])
-        
-        log_message("Step 1: Sort all edges by weight", "info")
-        for i, (u, v, w) in enumerate(edges):
-            log_message(f"  {i+1}. {u}↔{v}: weight={w}", "step")
-        
-        log_message("\nStep 2: Build MST (Union-Find)", "info")
-        
-        # Kruskal's with animation
-        parent = {node: node for node in G.nodes()}
-        rank = {node: 0 for node in G.nodes()}
-        
-        def find(x):
-            if parent[x] != x:
-                parent[x] = find(parent[x])
-            return parent[x]
-        
-        def union(x, y):
-            px, py = find(x), find(y)
-            if px == py:
-                return False
-            if rank[px] < rank[py]:
-                px, py = py, px
-            parent[py] = px
-            if rank[px] == rank[py]:
-                rank[px] += 1
-            return True
-        
-        mst_edges = []
-        total_weight = 0
-        
-        for i, (u, v, w) in enumerate(edges):
-            update_progress((i + 1) / len(edges) * 100)
+    clear_log()
+    update_algo_info(
+        "Kruskal's MST Algorithm",
+        "Time: O(E log E) | Space: O(V)",
+        "Finds minimum cost spanning tree using greedy edge selection with Union-Find."
+    )
+    update_status("Computing MST...", "processing")
+    
+    log_message("═══ MINIMUM SPANNING TREE (Kruskal's) ═══", "title")
+    log_message("Finding minimum cost network connections\n", "info")
+    
+    # Get sorted edges
+    edges, weights = sorted_edges()
+    
+    log_message("Step 1: Sort all edges by weight", "info")
+    for i, (u, v, w) in enumerate(edges):
+        log_message(f"  {i+1}. {u}↔{v}: weight={w}", "step")
+    
+    log_message("\nStep 2: Build MST (Union-Find)", "info")
+    
+    # MST is computed up front; the steps below only replay it.
+    # Among equal weights the tree edges go first, so every skipped
+    # edge really would close a cycle at that point of the replay.
+    csr = ensure_csr()
+    idx = csr.label_to_idx
+    tree = mst_pairs(csr)
+    keep = np.fromiter(((min(idx[u], idx[v]), max(idx[u], idx[v])) in tree for u, v, _ in edges),
+                       dtype=bool, count=len(edges))
+    order = np.lexsort((~keep, weights))
+    edges = [edges[i] for i in order]
+    keep = keep[order]
+    tree_size = len(G.nodes()) - 1
+    
+    def step(i, mst_edges, total_weight):
+        # Replay edges up to the next tree edge, then hand control back to Tk
+        while i < len(edges) and len(mst_edges) < tree_size:
+            u, v, w = edges[i]
+            added = keep[i]
+            i += 1
+            update_progress(i / len(edges) * 100)
             
-            if union(u, v):
+            if added:
                 mst_edges.append((u, v))
                 total_weight += w
                 log_message(f"  ✓ Added {u}↔{v} (weight={w}) - Trees merged!", "success")
                 
                 # Animate
-                draw_graph(highlight_edges=mst_edges,
-                          title=f"Building MST: {len(mst_edges)}/{len(G.nodes())-1} edges")
-                time.sleep(animation_speed)
-            else:
-                log_message(f"  ✗ Skipped {u}↔{v} - Would create cycle", "warning")
-            
-            if len(mst_edges) == len(G.nodes()) - 1:
-                break
+                draw_graph_update(mst_edges, title=f"Building MST: {len(mst_edges)}/{tree_size} edges")
+                root.after(int(animation_speed * 1000), step, i, mst_edges, total_weight)
+                return
+            log_message(f"  ✗ Skipped {u}↔{v} - Would create cycle", "warning")
         
-        # Final result
+        finish(mst_edges, total_weight)
+    
+    def finish(mst_edges, total_weight):
         draw_graph(highlight_edges=mst_edges,
                    title=f"✅ Minimum Spanning Tree (Total Weight: {total_weight})")
         
@@ -768,7 +1158,80 @@ def show_mst_animated():
         draw_statistics()
         draw_adjacency_matrix()
     
-    threading.Thread(target=run_animation, daemon=True).start()
+    step(0, [], 0)
+
+# --------------------------------
+# Path Search (Yen's K-Shortest Paths)
+# --------------------------------
+PATH_CACHE_SIZE = 1024
+_PATH_CACHE = {}  # (graph_version, src, dst, banned nodes, banned edges) -> (length, path)
+
+def cached_shortest_path(csr, source, target, ignore_nodes, ignore_edges):
+    """Dijkstra on G without the given nodes/edges, memoised per graph version"""
+    key = (graph_version, source, target, frozenset(ignore_nodes), frozenset(ignore_edges))
+    hit = _PATH_CACHE.get(key)
+    if hit is None:
+        nodes, idx, indptr, indices = csr.labels, csr.label_to_idx, csr.indptr, csr.indices
+        weights = csr.weights.copy()
+        if ignore_nodes:
+            weights[np.isin(indices, [idx[node] for node in ignore_nodes])] = np.inf
+        for u, v in ignore_edges:
+            for i, j in ((idx[u], idx[v]), (idx[v], idx[u])):
+                row = indices[indptr[i]:indptr[i+1]]
+                weights[indptr[i] + np.searchsorted(row, j)] = np.inf
+        
+        length, path = bidirectional_dijkstra_csr(indptr, indices, weights,
+                                                  idx[source], idx[target], len(nodes))
+        hit = (None, None) if np.isinf(length) else (length, [nodes[i] for i in path.tolist()])
+        # Stale versions are never looked up again and age out first
+        if len(_PATH_CACHE) >= PATH_CACHE_SIZE:
+            del _PATH_CACHE[next(iter(_PATH_CACHE))]
+        _PATH_CACHE[key] = hit
+    return hit
+
+def k_shortest_paths(source, target, avoid_edges=()):
+    """Yen's algorithm: yield loopless source-target paths in order of length"""
+    def path_length(path):
+        return sum(G[path[j]][path[j+1]]['weight'] for j in range(len(path)-1))
+    
+    csr = ensure_csr()
+    length, path = cached_shortest_path(csr, source, target, (), avoid_edges)
+    if path is None:
+        raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+    
+    found = []
+    candidates = []  # heap of (length, counter, path)
+    queued = set()
+    counter = 0
+    heapq.heappush(candidates, (length, counter, path))
+    queued.add(tuple(path))
+    
+    while candidates:
+        _, _, path = heapq.heappop(candidates)
+        queued.remove(tuple(path))
+        yield path
+        found.append(path)
+        
+        ignore_nodes = set()
+        ignore_edges = set(avoid_edges)
+        for i in range(1, len(path)):
+            root_path = path[:i]
+            for p in found:
+                if p[:i] == root_path:
+                    ignore_edges.add((p[i-1], p[i]))
+            length, spur = cached_shortest_path(csr, root_path[-1], target, ignore_nodes, ignore_edges)
+            if spur is not None:
+                candidate = root_path[:-1] + spur
+                if tuple(candidate) not in queued:
+                    counter += 1
+                    heapq.heappush(candidates, (path_length(root_path) + length, counter, candidate))
+                    queued.add(tuple(candidate))
+            ignore_nodes.add(root_path[-1])
+
+@lru_cache(maxsize=256)
+def yen_paths(version, source, target, k, avoid_edges):
+    """First k paths of k_shortest_paths(), memoised per graph version"""
+    return tuple(tuple(path) for path in islice(k_shortest_paths(source, target, avoid_edges), k))
 
 # --------------------------------
 # Q2: K-Shortest Paths with Animation
@@ -833,16 +1296,12 @@ def find_reliable_paths():
     
     avoid_var = tk.BooleanVar(value=True)
     avoid_check = tk.Checkbutton(options_frame, text="⚠️ Avoid vulnerable roads",
-                                  variable=avoid_var, bg=COLORS["card"], fg=COLORS["text"],
-                                  selectcolor=COLORS["surface"], font=("Segoe UI", 10),
-                                  activebackground=COLORS["card"])
+                                  variable=avoid_var, **OPTION_STYLE)
     avoid_check.pack(side=tk.LEFT)
     
     animate_var = tk.BooleanVar(value=True)
     animate_check = tk.Checkbutton(options_frame, text="🎬 Animate search",
-                                    variable=animate_var, bg=COLORS["card"], fg=COLORS["text"],
-                                    selectcolor=COLORS["surface"], font=("Segoe UI", 10),
-                                    activebackground=COLORS["card"])
+                                    variable=animate_var, **OPTION_STYLE)
     animate_check.pack(side=tk.LEFT, padx=20)
     
     # Results section
@@ -852,19 +1311,15 @@ def find_reliable_paths():
     result_frame = tk.Frame(path_window, bg=COLORS["surface"])
     result_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
     
-    result_text = tk.Text(result_frame, bg=COLORS["surface"], fg=COLORS["text"],
-                          font=("Consolas", 10), wrap=tk.WORD, relief="flat")
+    result_text = tk.Text(result_frame, relief="flat", **RESULT_TEXT_STYLE)
     result_scroll = ttk.Scrollbar(result_frame, orient="vertical", command=result_text.yview)
     result_text.configure(yscrollcommand=result_scroll.set)
     
     result_scroll.pack(side=tk.RIGHT, fill=tk.Y)
     result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8, pady=8)
     
-    result_text.tag_configure("header", foreground=COLORS["lavender"], font=("Consolas", 11, "bold"))
-    result_text.tag_configure("path", foreground=COLORS["success"])
-    result_text.tag_configure("info", foreground=COLORS["warning"])
-    result_text.tag_configure("error", foreground=COLORS["error"])
-    result_text.tag_configure("best", foreground=COLORS["teal"], font=("Consolas", 10, "bold"))
+    for tag, style in PATH_RESULT_TAGS:
+        result_text.tag_configure(tag, **style)
     
     def compute_paths():
         def run_search():
@@ -892,14 +1347,14 @@ def find_reliable_paths():
                 result_text.delete(1.0, tk.END)
                 result_text.insert(tk.END, f"🔍 Searching for {k} shortest paths: {source} → {dest}\n\n", "header")
                 
-                # Create working graph
-                G_work = G.copy()
+                # Vulnerable roads are excluded from every search
+                avoid_edges = []
                 avoided = []
                 
                 if avoid_var.get() and vulnerable_roads:
                     for edge in vulnerable_roads:
-                        if G_work.has_edge(edge[0], edge[1]):
-                            G_work.remove_edge(edge[0], edge[1])
+                        if G.has_edge(edge[0], edge[1]):
+                            avoid_edges.append(tuple(sorted(edge)))
                             avoided.append(f"{edge[0]}↔{edge[1]}")
                     
                     if avoided:
@@ -908,7 +1363,7 @@ def find_reliable_paths():
                 
                 # Find paths
                 try:
-                    paths = list(nx.shortest_simple_paths(G_work, source, dest, weight='weight'))[:k]
+                    paths = yen_paths(graph_version, source, dest, k, frozenset(avoid_edges))
                 except nx.NetworkXNoPath:
                     result_text.insert(tk.END, "❌ No path exists between these nodes!\n", "error")
                     log_message("No path found!", "error")
@@ -922,23 +1377,23 @@ def find_reliable_paths():
                 result_text.insert(tk.END, f"✅ Found {len(paths)} path(s):\n\n", "header")
                 
                 for i, path in enumerate(paths, 1):
-                    length = sum(G[path[j]][path[j+1]]['weight'] for j in range(len(path)-1))
+                    path_edges = list(zip(path, path[1:]))
+                    weights = [G[u][v]['weight'] for u, v in path_edges]
+                    length = sum(weights)
                     path_str = " → ".join(path)
                     
                     tag = "best" if i == 1 else "path"
                     prefix = "🥇 BEST" if i == 1 else f"#{i}"
                     
-                    result_text.insert(tk.END, f"{prefix}: {path_str}\n", tag)
-                    result_text.insert(tk.END, f"   📏 Distance: {length}\n", "info")
-                    
-                    edges_str = " + ".join([f"{path[j]}→{path[j+1]}({G[path[j]][path[j+1]]['weight']})" 
-                                           for j in range(len(path)-1)])
-                    result_text.insert(tk.END, f"   🔗 Edges: {edges_str}\n\n")
+                    edges_str = " + ".join(f"{u}→{v}({w})" for (u, v), w in zip(path_edges, weights))
+                    # One Text round-trip per path: (text, tags) pairs in display order
+                    result_text.insert(tk.END, f"{prefix}: {path_str}\n", tag,
+                                       f"   📏 Distance: {length}\n", "info",
+                                       f"   🔗 Edges: {edges_str}\n\n", ())
                     
                     log_message(f"Path {i}: {path_str} (length={length})", "success")
                     
                     if animate_var.get():
-                        path_edges = [(path[j], path[j+1]) for j in range(len(path)-1)]
                         draw_graph(path_edges=path_edges if i > 1 else None,
                                    highlight_edges=path_edges if i == 1 else None,
                                    title=f"Path {i}: {path_str}")
@@ -946,7 +1401,7 @@ def find_reliable_paths():
                 
                 # Show best path
                 best_path = paths[0]
-                best_edges = [(best_path[j], best_path[j+1]) for j in range(len(best_path)-1)]
+                best_edges = list(zip(best_path, best_path[1:]))
                 draw_graph(highlight_edges=best_edges,
                            title=f"Best Path: {' → '.join(best_path)}")
                 
@@ -972,6 +1427,85 @@ def find_reliable_paths():
               bg=COLORS["surface"], fg=COLORS["text"], font=("Segoe UI", 10),
               relief="flat", padx=20, pady=10).pack(side=tk.LEFT, padx=8)
 
+# --------------------------------
+# Command Tree Walks (explicit stacks, no recursion limit)
+# --------------------------------
+def iter_preorder(node):
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def iter_inorder(node):
+    stack = []
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+def iter_postorder(node):
+    """Post-order is the reverse of a right-first pre-order"""
+    order = []
+    stack = [node] if node else []
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if node.left:
+            stack.append(node.left)
+        if node.right:
+            stack.append(node.right)
+    yield from reversed(order)
+
+def iter_levelorder(node):
+    queue = deque([node] if node else [])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+def tree_depth(node):
+    depth = 0
+    stack = [(node, 1)] if node else []
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        if node.left:
+            stack.append((node.left, level + 1))
+        if node.right:
+            stack.append((node.right, level + 1))
+    return depth
+
+def count_nodes(node):
+    return sum(1 for _ in iter_preorder(node))
+
+def build_balanced(names):
+    """Balanced tree over sorted names, each subtree rooted at its middle name"""
+    tree_root = None
+    stack = [(0, len(names), 0, None, None)]  # (lo, hi, level, parent, side)
+    while stack:
+        lo, hi, level, parent, side = stack.pop()
+        if lo >= hi:
+            continue
+        mid = (lo + hi) // 2
+        node = CommandNode(names[mid], level)
+        if parent is None:
+            tree_root = node
+        else:
+            setattr(parent, side, node)
+        stack.append((mid + 1, hi, level + 1, node, "right"))
+        stack.append((lo, mid, level + 1, node, "left"))
+    return tree_root
+
 # --------------------------------
 # Q3: Command Hierarchy with Tree Traversals
 # --------------------------------
@@ -1038,104 +1572,109 @@ def show_command_tree():
     traversal_scroll.pack(side=tk.RIGHT, fill=tk.Y)
     traversal_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     
-    traversal_text.tag_configure("title", foreground=COLORS["lavender"], font=("Consolas", 10, "bold"))
-    traversal_text.tag_configure("node", foreground=COLORS["success"])
-    traversal_text.tag_configure("info", foreground=COLORS["warning"])
+    for tag, style in TRAVERSAL_TAGS:
+        traversal_text.tag_configure(tag, **style)
     
     current_root = [hq]  # Use list for mutable reference
     
-    def draw_tree(root_node, highlight_nodes=None, title="Command Hierarchy"):
-        ax_tree.clear()
-        ax_tree.set_facecolor("#1a1a2e")
-        ax_tree.set_title(title, fontsize=12, fontweight='bold', color=COLORS["text"], pad=10)
+    tree_layouts = {}  # root node -> tree_layout() result; trees are rebuilt, never edited in place
+    
+    def tree_layout(root_node):
+        """Graph, levels, positions, level colours and stats text of a tree, computed once per root"""
+        if root_node in tree_layouts:
+            return tree_layouts[root_node]
         
         T = nx.DiGraph()
         levels = {}
         
-        def add_edges(node, level=0):
-            if node:
-                levels[node.name] = level
-                if node.left:
-                    T.add_edge(node.name, node.left.name)
-                    add_edges(node.left, level + 1)
-                if node.right:
-                    T.add_edge(node.name, node.right.name)
-                    add_edges(node.right, level + 1)
+        stack = [(root_node, None, 0)] if root_node else []
+        while stack:
+            node, parent, level = stack.pop()
+            levels[node.name] = level
+            if parent:
+                T.add_edge(parent.name, node.name)
+            if node.right:
+                stack.append((node.right, node, level + 1))
+            if node.left:
+                stack.append((node.left, node, level + 1))
         
-        add_edges(root_node)
+        # Hierarchical layout: each level spread left to right in name order
+        names = np.array(list(levels))
+        depth = np.fromiter(levels.values(), int, len(levels))
+        order = np.lexsort((names, depth))
+        depth = depth[order]
+        counts = np.bincount(depth)
+        width = counts[depth]
+        idx = np.arange(len(order)) - (np.cumsum(counts) - counts)[depth]
+        xs = (idx - width/2 + 0.5) * (3 / np.maximum(width, 1))
+        ys = -depth * 1.5
+        tree_pos = dict(zip(names[order].tolist(), zip(xs.tolist(), ys.tolist())))
         
-        if T.number_of_nodes() == 0:
-            ax_tree.text(0.5, 0.5, "Empty tree", ha='center', va='center',
-                        color=COLORS["subtext"], fontsize=14)
-            canvas_tree.draw()
-            return
+        # Gradient by level
+        max_level = max(levels.values()) if levels else 1
+        level_colors = [plt.cm.viridis(0.3 + levels.get(n, 0) / max(max_level, 1) * 0.5) for n in T.nodes()]
         
-        # Hierarchical layout
-        tree_pos = {}
-        level_counts = {}
-        level_indices = {}
+        depth = tree_depth(root_node)
+        nodes = count_nodes(root_node)
+        optimal = int(np.ceil(np.log2(nodes + 1)))
         
-        for node, level in levels.items():
-            if level not in level_counts:
-                level_counts[level] = 0
-                level_indices[level] = 0
-            level_counts[level] += 1
+        info = f"📊 Tree Statistics\n"
+        info += f"─────────────────\n"
+        info += f"Nodes: {nodes}\n"
+        info += f"Max Depth: {depth}\n"
+        info += f"Optimal Depth: {optimal}\n"
+        info += f"Balance: {'✅ Good' if depth <= optimal + 1 else '⚠️ Unbalanced'}"
         
-        for node, level in sorted(levels.items(), key=lambda x: (x[1], x[0])):
-            width = level_counts[level]
-            idx = level_indices[level]
-            x = (idx - width/2 + 0.5) * (3 / max(width, 1))
-            y = -level * 1.5
-            tree_pos[node] = (x, y)
-            level_indices[level] += 1
+        tree_layouts[root_node] = (T, tree_pos, level_colors, info)
+        return tree_layouts[root_node]
+    
+    tree_artists = {}  # root node and node collection of the last full draw_tree()
+    
+    def draw_tree(root_node, highlight_nodes=None, title="Command Hierarchy"):
+        T, tree_pos, level_colors, info = tree_layout(root_node)
         
         # Node colors
-        max_level = max(levels.values()) if levels else 1
         node_colors = []
-        for n in T.nodes():
+        for n, color in zip(T.nodes(), level_colors):
             if highlight_nodes and n in highlight_nodes:
                 node_colors.append(COLORS["node_current"])
             else:
-                # Gradient by level
-                level_ratio = levels.get(n, 0) / max(max_level, 1)
-                node_colors.append(plt.cm.viridis(0.3 + level_ratio * 0.5))
+                node_colors.append(color)
+        
+        # Same tree as the last draw: only the highlight and title change
+        if tree_artists and tree_artists["root"] is root_node:
+            ax_tree.title.set_text(title)
+            tree_artists["nodes"].set_facecolor(node_colors)
+            canvas_tree.draw_idle()
+            return
+        
+        ax_tree.clear()
+        ax_tree.set_facecolor("#1a1a2e")
+        ax_tree.set_title(title, fontsize=12, fontweight='bold', color=COLORS["text"], pad=10)
+        tree_artists.clear()
+        
+        if T.number_of_nodes() == 0:
+            ax_tree.text(0.5, 0.5, "Empty tree", ha='center', va='center',
+                        color=COLORS["subtext"], fontsize=14)
+            canvas_tree.draw_idle()
+            return
         
         # Draw
         nx.draw_networkx_edges(T, tree_pos, ax=ax_tree, edge_color=COLORS["text"],
                                arrows=True, arrowsize=20, alpha=0.7, width=2)
         
-        nx.draw_networkx_nodes(T, tree_pos, ax=ax_tree, node_color=node_colors,
-                               node_size=3000, alpha=0.9, edgecolors='white', linewidths=2)
+        node_artist = nx.draw_networkx_nodes(T, tree_pos, ax=ax_tree, node_color=node_colors,
+                                             node_size=3000, alpha=0.9, edgecolors='white', linewidths=2)
         
         nx.draw_networkx_labels(T, tree_pos, ax=ax_tree, font_size=8,
                                 font_weight='bold', font_color='white')
         
         ax_tree.axis('off')
         fig_tree.tight_layout()
-        canvas_tree.draw()
+        canvas_tree.draw_idle()
+        tree_artists.update(root=root_node, nodes=node_artist)
         
         # Update info
-        def max_depth(node):
-            if node is None:
-                return 0
-            return 1 + max(max_depth(node.left), max_depth(node.right))
-        
-        def count_nodes(node):
-            if node is None:
-                return 0
-            return 1 + count_nodes(node.left) + count_nodes(node.right)
-        
-        depth = max_depth(root_node)
-        nodes = count_nodes(root_node)
-        optimal = int(np.ceil(np.log2(nodes + 1)))
-        
-        info = f"📊 Tree Statistics\n"
-        info += f"─────────────────\n"
-        info += f"Nodes: {nodes}\n"
-        info += f"Max Depth: {depth}\n"
-        info += f"Optimal Depth: {optimal}\n"
-        info += f"Balance: {'✅ Good' if depth <= optimal + 1 else '⚠️ Unbalanced'}"
-        
         tree_info_label.config(text=info)
     
     def run_traversal(traversal_type):
@@ -1143,76 +1682,34 @@ def show_command_tree():
         traversal_text.insert(tk.END, f"═══ {traversal_type.upper()} TRAVERSAL ═══\n\n", "title")
         
         visited = []
+        visited_set = set()
+        walks = {"In-Order": iter_inorder, "Pre-Order": iter_preorder,
+                 "Post-Order": iter_postorder, "Level-Order": iter_levelorder}
         
-        def inorder(node):
-            if node:
-                inorder(node.left)
-                visited.append(node.name)
-                traversal_text.insert(tk.END, f"  → {node.name}\n", "node")
-                traversal_text.see(tk.END)
-                draw_tree(current_root[0], highlight_nodes=set(visited),
-                         title=f"{traversal_type}: Visiting {node.name}")
-                root.update()
-                time.sleep(animation_speed * 0.3)
-                inorder(node.right)
+        # Large trees repaint every few visits instead of on every node
+        redraw_every = max(1, count_nodes(current_root[0]) // 20)
         
-        def preorder(node):
-            if node:
-                visited.append(node.name)
-                traversal_text.insert(tk.END, f"  → {node.name}\n", "node")
-                traversal_text.see(tk.END)
-                draw_tree(current_root[0], highlight_nodes=set(visited),
-                         title=f"{traversal_type}: Visiting {node.name}")
-                root.update()
-                time.sleep(animation_speed * 0.3)
-                preorder(node.left)
-                preorder(node.right)
+        walk = walks[traversal_type](current_root[0])
         
-        def postorder(node):
-            if node:
-                postorder(node.left)
-                postorder(node.right)
+        def step(count):
+            # Visit nodes up to the next repaint, then hand control back to Tk
+            for node in walk:
+                count += 1
                 visited.append(node.name)
+                visited_set.add(node.name)
                 traversal_text.insert(tk.END, f"  → {node.name}\n", "node")
                 traversal_text.see(tk.END)
-                draw_tree(current_root[0], highlight_nodes=set(visited),
-                         title=f"{traversal_type}: Visiting {node.name}")
-                root.update()
-                time.sleep(animation_speed * 0.3)
-        
-        def levelorder(node):
-            if not node:
-                return
-            queue = deque([node])
-            while queue:
-                curr = queue.popleft()
-                visited.append(curr.name)
-                traversal_text.insert(tk.END, f"  → {curr.name}\n", "node")
-                traversal_text.see(tk.END)
-                draw_tree(current_root[0], highlight_nodes=set(visited),
-                         title=f"{traversal_type}: Visiting {curr.name}")
-                root.update()
-                time.sleep(animation_speed * 0.3)
-                if curr.left:
-                    queue.append(curr.left)
-                if curr.right:
-                    queue.append(curr.right)
-        
-        def run():
-            if traversal_type == "In-Order":
-                inorder(current_root[0])
-            elif traversal_type == "Pre-Order":
-                preorder(current_root[0])
-            elif traversal_type == "Post-Order":
-                postorder(current_root[0])
-            elif traversal_type == "Level-Order":
-                levelorder(current_root[0])
+                if count % redraw_every == 0:
+                    draw_tree(current_root[0], highlight_nodes=visited_set,
+                             title=f"{traversal_type}: Visiting {node.name}")
+                    root.after(int(animation_speed * 300), step, count)
+                    return
             
             traversal_text.insert(tk.END, f"\n✅ Traversal complete!\n", "info")
             traversal_text.insert(tk.END, f"Order: {' → '.join(visited)}\n", "node")
             draw_tree(current_root[0], title="Traversal Complete")
         
-        threading.Thread(target=run, daemon=True).start()
+        step(0)
     
     def optimize_tree():
         traversal_text.delete(1.0, tk.END)
@@ -1220,28 +1717,13 @@ def show_command_tree():
         traversal_text.insert(tk.END, "Using Divide & Conquer to balance...\n\n", "info")
         
         # Collect nodes
-        nodes = []
-        def collect(node):
-            if node:
-                nodes.append(node.name)
-                collect(node.left)
-                collect(node.right)
-        collect(current_root[0])
+        nodes = [node.name for node in iter_preorder(current_root[0])]
         
         traversal_text.insert(tk.END, f"Nodes collected: {nodes}\n", "node")
         traversal_text.insert(tk.END, f"Sorting nodes...\n\n", "info")
         
         sorted_nodes = sorted(nodes)
         
-        def build_balanced(names, level=0):
-            if not names:
-                return None
-            mid = len(names) // 2
-            node = CommandNode(names[mid], level)
-            node.left = build_balanced(names[:mid], level + 1)
-            node.right = build_balanced(names[mid+1:], level + 1)
-            return node
-        
         current_root[0] = build_balanced(sorted_nodes)
         draw_tree(current_root[0], title="✅ Optimized Balanced Tree")
         
@@ -1313,12 +1795,10 @@ def simulate_failure():
     type_frame.pack(fill=tk.X, padx=15, pady=5)
     
     tk.Radiobutton(type_frame, text="🔴 Node Failure", variable=fail_type, value="node",
-                   bg=COLORS["card"], fg=COLORS["text"], selectcolor=COLORS["surface"],
-                   font=("Segoe UI", 10), activebackground=COLORS["card"]).pack(side=tk.LEFT, padx=10)
+                   **OPTION_STYLE).pack(side=tk.LEFT, padx=10)
     
     tk.Radiobutton(type_frame, text="🔗 Edge Failure", variable=fail_type, value="edge",
-                   bg=COLORS["card"], fg=COLORS["text"], selectcolor=COLORS["surface"],
-                   font=("Segoe UI", 10), activebackground=COLORS["card"]).pack(side=tk.LEFT, padx=10)
+                   **OPTION_STYLE).pack(side=tk.LEFT, padx=10)
     
     # Node selection
     node_frame = tk.Frame(select_frame, bg=COLORS["card"])
@@ -1327,9 +1807,10 @@ def simulate_failure():
     tk.Label(node_frame, text="Target Node:", font=("Segoe UI", 10),
              bg=COLORS["card"], fg=COLORS["text"]).pack(side=tk.LEFT)
     
-    node_var = tk.StringVar(value=list(G.nodes())[0] if G.nodes() else "")
+    nodes_list = list(G.nodes())
+    node_var = tk.StringVar(value=nodes_list[0] if nodes_list else "")
     node_combo = ttk.Combobox(node_frame, textvariable=node_var,
-                               values=list(G.nodes()), state="readonly", width=15)
+                               values=nodes_list, state="readonly", width=15)
     node_combo.pack(side=tk.LEFT, padx=10)
     
     # Edge selection
@@ -1352,25 +1833,21 @@ def simulate_failure():
     result_frame = tk.Frame(fail_window, bg=COLORS["surface"])
     result_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=5)
     
-    result_text = tk.Text(result_frame, bg=COLORS["surface"], fg=COLORS["text"],
-                          font=("Consolas", 10), wrap=tk.WORD)
+    result_text = tk.Text(result_frame, **RESULT_TEXT_STYLE)
     result_scroll = ttk.Scrollbar(result_frame, orient="vertical", command=result_text.yview)
     result_text.configure(yscrollcommand=result_scroll.set)
     
     result_scroll.pack(side=tk.RIGHT, fill=tk.Y)
     result_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8, pady=8)
     
-    result_text.tag_configure("header", foreground=COLORS["lavender"], font=("Consolas", 11, "bold"))
-    result_text.tag_configure("danger", foreground=COLORS["error"])
-    result_text.tag_configure("warning", foreground=COLORS["warning"])
-    result_text.tag_configure("success", foreground=COLORS["success"])
-    result_text.tag_configure("info", foreground=COLORS["accent"])
+    for tag, style in FAILURE_RESULT_TAGS:
+        result_text.tag_configure(tag, **style)
     
     def run_simulation():
         clear_log()
         update_algo_info(
             "Failure Impact Analysis",
-            "Time: O(V²) for all-pairs paths",
+            "Time: O(V(E + V log V)) all-pairs Dijkstra",
             "Analyzes network connectivity and path changes after component failure."
         )
         
@@ -1397,34 +1874,37 @@ def simulate_failure():
             result_text.insert(tk.END, f"   Connections: {affected_edges}\n")
             result_text.insert(tk.END, f"   Neighbors: {', '.join(neighbors)}\n\n")
             
-            # Store path info
+            # Store path info: one Dijkstra per source instead of one per pair
+            others = [n for n in G.nodes() if n != node]
             old_paths = {}
-            for s in G.nodes():
-                for t in G.nodes():
-                    if s != t and s != node and t != node:
-                        try:
-                            old_paths[(s,t)] = nx.shortest_path_length(G, s, t, weight='weight')
-                        except:
-                            old_paths[(s,t)] = float('inf')
+            affected = []  # sources whose shortest paths run through the node
+            for s in others:
+                pred, old_paths[s] = nx.dijkstra_predecessor_and_distance(G, s, weight='weight')
+                if any(node in p for p in pred.values()):
+                    affected.append(s)
             
             # Remove node
             failed_nodes.add(node)
             G.remove_node(node)
-            if node in pos:
-                del pos[node]
+            graph_changed()
+            pos.pop(node, None)
             
-            # Analyze impact
+            # Analyze impact: distances from unaffected sources cannot change
+            new_paths = {s: nx.single_source_dijkstra_path_length(G, s, weight='weight') for s in affected}
             disconnected = []
             increased = []
             
-            for (s,t), old_len in old_paths.items():
-                if s in G.nodes() and t in G.nodes():
-                    try:
-                        new_len = nx.shortest_path_length(G, s, t, weight='weight')
-                        if new_len > old_len:
-                            increased.append((s, t, new_len - old_len))
-                    except:
+            for s in others:
+                old_dist = old_paths[s]
+                new_dist = new_paths.get(s, old_dist)
+                for t in others:
+                    if s == t:
+                        continue
+                    new_len = new_dist.get(t)
+                    if new_len is None:
                         disconnected.append((s, t))
+                    elif new_len > old_dist[t]:
+                        increased.append((s, t, new_len - old_dist[t]))
             
             # Display results
             result_text.insert(tk.END, "─────── IMPACT ANALYSIS ───────\n\n")
@@ -1455,9 +1935,10 @@ def simulate_failure():
                         result_text.insert(tk.END, f"   Component {i}: {', '.join(sorted(comp))}\n")
             
             # Update combo
-            node_combo.config(values=list(G.nodes()))
-            if G.nodes():
-                node_var.set(list(G.nodes())[0])
+            remaining = list(G.nodes())
+            node_combo.config(values=remaining)
+            if remaining:
+                node_var.set(remaining[0])
             
             edge_combo.config(values=[f"{u}-{v}" for u, v in G.edges()])
             
@@ -1482,6 +1963,7 @@ def simulate_failure():
             
             # Remove edge
             G.remove_edge(u, v)
+            graph_changed()
             vulnerable_roads.add((u, v))
             
             # Check connectivity
@@ -1489,8 +1971,7 @@ def simulate_failure():
             
             if nx.is_connected(G):
                 try:
-                    new_path = nx.shortest_path(G, u, v, weight='weight')
-                    new_len = nx.shortest_path_length(G, u, v, weight='weight')
+                    new_len, new_path = nx.bidirectional_dijkstra(G, u, v, weight='weight')
                     result_text.insert(tk.END, f"✅ Alternative path exists:\n", "success")
                     result_text.insert(tk.END, f"   Path: {' → '.join(new_path)}\n")
                     result_text.insert(tk.END, f"   New distance: {new_len} (was {weight})\n")
@@ -1545,8 +2026,10 @@ def color_graph_animated():
         log_message("═══ GRAPH COLORING (Frequency Assignment) ═══", "title")
         log_message("Using Greedy Algorithm with Largest-First ordering\n", "info")
         
-        # Sort nodes by degree
-        nodes_by_degree = sorted(G.nodes(), key=lambda x: G.degree(x), reverse=True)
+        # Sort nodes by degree (stable, so equal degrees keep G.nodes() order)
+        nodes = list(G.nodes())
+        degrees = np.fromiter((d for _, d in G.degree(nodes)), dtype=np.int32, count=len(nodes))
+        nodes_by_degree = [nodes[i] for i in np.argsort(-degrees, kind='stable')]
         
         log_message("Step 1: Order nodes by degree (descending)", "info")
         for i, node in enumerate(nodes_by_degree):
@@ -1577,12 +2060,11 @@ def color_graph_animated():
                 cmap = plt.cm.get_cmap('Set3')
             
             max_color = max(coloring.values()) + 1
-            node_colors = []
-            for n in G.nodes():
-                if n in coloring:
-                    node_colors.append(cmap(coloring[n] / max(max_color, 1)))
-                else:
-                    node_colors.append(COLORS["surface"])
+            assigned = np.fromiter((coloring.get(n, -1) for n in nodes), dtype=np.float64, count=len(nodes))
+            node_colors = np.empty((len(nodes), 4))
+            node_colors[:] = mcolors.to_rgba(COLORS["surface"])
+            done = assigned >= 0
+            node_colors[done] = cmap(assigned[done] / max(max_color, 1))
             
             draw_graph(node_colors=node_colors, title=f"Coloring: {len(coloring)}/{len(G.nodes())} nodes")
             time.sleep(animation_speed * 0.3)
@@ -1623,6 +2105,7 @@ def add_node():
             messagebox.showwarning("Warning", "Node already exists")
             return
         G.add_node(name)
+        graph_changed()
         pos[name] = (np.random.rand() * 2 - 1, np.random.rand() * 2 - 1)
         draw_graph(title=f"Added Node: {name}")
         draw_statistics()
@@ -1690,6 +2173,7 @@ def add_edge():
                 messagebox.showerror("Error", "Cannot add self-loop")
                 return
             G.add_edge(s, d, weight=w)
+            graph_changed()
             draw_graph(title=f"Added Edge: {s}↔{d}")
             draw_statistics()
             draw_adjacency_matrix()
@@ -1750,6 +2234,7 @@ def mark_vulnerable():
 def reset_graph():
     global G, pos
     G = original_graph.copy()
+    graph_changed()
     pos = nx.spring_layout(G, seed=42, k=2)
     vulnerable_roads.clear()
     failed_nodes.clear()